@@ -0,0 +1,179 @@
+import asyncio
+import http.server
+import json
+import math
+import os
+import threading
+
+import pytest
+import requests
+
+from toollm import fetch as fetch_module
+from toollm import download_files
+from toollm.fetch import Fetch
+
+
+# Well-formed documents: every extractor must produce the same text
+WELL_FORMED_DOCS = [
+    b'<html><head><title>T</title><style>x{}</style></head>'
+    b'<body><h1>Hi</h1><p>a <b>b</b> c</p><script>s()</script>'
+    b'<ul><li>1</li><li>2</li></ul></body></html>',
+    b'<html><body><div>lead<noscript>enable JS</noscript></div><p>body</p></body></html>',
+    b'<html><head><meta charset="utf-8"></head><body><p>caf\xc3\xa9</p>'
+    b'<table><tr><td>x</td><td>y</td></tr></table></body></html>',
+    '<p>unicode 中文</p><p>second</p>',
+]
+
+
+@pytest.fixture
+def fetch():
+    f = Fetch()
+    yield f
+    f.close()
+
+
+def test_default_extractor_drops_noscript_with_block_content(fetch, monkeypatch):
+    monkeypatch.setattr(fetch_module, '_USE_LEXBOR', False)
+    html = '<p>lead<noscript><div>Please enable JavaScript</div></noscript></p>body'
+    assert fetch._html_to_text(html) == 'lead\nbody'
+    assert fetch._html_to_text(html.encode()) == 'lead\nbody'
+    assert fetch._html_to_text(iter([html[:10].encode(), html[10:].encode()])) == 'lead\nbody'
+
+
+def test_lexbor_is_opt_in_when_lxml_is_available():
+    if fetch_module._etree is not None and fetch_module._LexborHTMLParser is not None:
+        assert fetch_module._USE_LEXBOR == (os.environ.get('TOOLLM_LEXBOR') == '1')
+
+
+def test_default_extractor_keeps_cell_separator(fetch, monkeypatch):
+    monkeypatch.setattr(fetch_module, '_USE_LEXBOR', False)
+    assert fetch._html_to_text('<b>one<td>two</td></b>') == 'one\ntwo'
+
+
+@pytest.mark.skipif(fetch_module._LexborHTMLParser is None, reason='selectolax not installed')
+@pytest.mark.parametrize('html', WELL_FORMED_DOCS)
+def test_lexbor_matches_lxml(fetch, monkeypatch, html):
+    monkeypatch.setattr(fetch_module, '_USE_LEXBOR', False)
+    assert fetch._lexbor_to_text(html) == fetch._html_to_text(html)
+
+
+@pytest.mark.parametrize('html', WELL_FORMED_DOCS)
+def test_soup_matches_lxml(fetch, monkeypatch, html):
+    monkeypatch.setattr(fetch_module, '_USE_LEXBOR', False)
+    assert fetch._soup_to_text(html) == fetch._html_to_text(html)
+
+
+def _response_with(content_disposition):
+    response = requests.Response()
+    response.headers['Content-Disposition'] = content_disposition
+    return response
+
+
+@pytest.mark.parametrize('header, expected', [
+    # Plain filename= values are taken verbatim, even if they look like charset'lang'value
+    ("attachment; filename=utf-8'x'y", "utf-8'x'y"),
+    ('attachment; filename="report.pdf"', 'report.pdf'),
+    ('attachment; filename=report.pdf', 'report.pdf'),
+    # RFC 5987 filename*= is decoded with its charset and wins over filename=
+    ("attachment; filename*=UTF-8''na%C3%AFve%20file.txt", 'naïve file.txt'),
+    ("attachment; filename=fallback.txt; filename*=UTF-8'en'na%C3%AFve.txt", 'naïve.txt'),
+    ("attachment; filename*=iso-8859-1''caf%E9.txt; filename=cafe.txt", 'café.txt'),
+])
+def test_filename_from_content_disposition(fetch, header, expected):
+    response = _response_with(header)
+    assert fetch._get_filename_from_response(response, 'https://example.com/ignored') == expected
+
+
+@pytest.fixture
+def file_server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            # Body identifies the URL, so a clobbered file is detectable
+            body = self.path.encode() * 10000
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+
+
+def test_download_files_gives_colliding_names_unique_paths(file_server, tmp_path):
+    urls = [f'{file_server}/{d}/file.zip' for d in 'abc']
+    results = download_files(urls, workdir=str(tmp_path))
+
+    assert all(r['success'] for r in results)
+    paths = [r['file_path'] for r in results]
+    assert len(set(paths)) == len(urls)
+    for url, path in zip(urls, paths):
+        expected = url[len(file_server):].encode() * 10000
+        with open(path, 'rb') as f:
+            assert f.read() == expected
+
+
+@pytest.fixture
+def header_server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = json.dumps(dict(self.headers)).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+
+
+def test_header_edits_reach_sync_and_async_requests(header_server):
+    async def run():
+        f = Fetch()
+        try:
+            assert isinstance(f.headers, dict)
+            first = await f.aget(header_server, format='json')
+            f.headers['X-Token'] = 'late'
+            sync = f.get(header_server, format='json')
+            later = await f.aget(header_server, format='json')
+            override = await f.aget(header_server, format='json', headers={'X-Token': 'call'})
+        finally:
+            await f.aclose()
+        return first, sync, later, override
+
+    first, sync, later, override = asyncio.run(run())
+    assert 'X-Token' not in first['content']
+    assert sync['content']['X-Token'] == 'late'
+    assert later['content']['X-Token'] == 'late'
+    assert override['content']['X-Token'] == 'call'
+    assert later['content']['User-Agent'].startswith('Mozilla/5.0')
+
+
+@pytest.mark.parametrize('body, expected', [
+    (b'{"id": 123456789012345678901234567890}', {'id': 123456789012345678901234567890}),
+    (b'[-9223372036854775809, 1.5]', [-9223372036854775809, 1.5]),
+    (b'{"x": NaN, "y": Infinity}', None),
+    ('{"name": "café"}'.encode('utf-16'), {'name': 'café'}),
+    (b'{"plain": [1, 2, 3]}', {'plain': [1, 2, 3]}),
+])
+def test_parse_json_matches_stdlib(fetch, body, expected):
+    response = requests.Response()
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    result = fetch._parse_json(response)
+    if expected is None:
+        assert math.isnan(result['x']) and math.isinf(result['y'])
+    else:
+        assert result == expected
+        assert type(result) is type(response.json())
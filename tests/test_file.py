@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from toollm import File
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason='symlinks not supported')
+def test_symlink_created_after_lookup_is_rejected(tmp_path):
+    workdir = tmp_path / 'work'
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'secret.txt').write_text('S')
+
+    file_ops = File(str(workdir))
+    assert not file_ops.read_file('lnk/secret.txt')['success']
+
+    os.symlink(outside, workdir / 'lnk')
+
+    assert not file_ops.read_file('lnk/secret.txt')['success']
+    result = file_ops.search_replace('lnk/secret.txt', [{'original_text': 'S', 'new_text': 'X'}])
+    assert not result['success']
+    assert (outside / 'secret.txt').read_text() == 'S'
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n', b'\r'])
+@pytest.mark.parametrize('trailing', [True, False])
+def test_line_range_counts_lines_like_full_read(tmp_path, newline, trailing):
+    data = newline.join([b'l1', b'l2', b'l3']) + (newline if trailing else b'')
+    (tmp_path / 'f.txt').write_bytes(data)
+    file_ops = File(str(tmp_path))
+
+    full = file_ops.read_file('f.txt')
+    assert full['total_lines'] == 3
+    for start, end in [(1, 1), (2, 2), (2, 3), (1, 3)]:
+        ranged = file_ops.read_file('f.txt', start, end)
+        assert ranged['success'], ranged
+        assert ranged['total_lines'] == full['total_lines']
+        assert ranged['content'] == ''.join(full['content'].splitlines(True)[start - 1:end])
+    assert not file_ops.read_file('f.txt', 3, 4)['success']
@@ -14,7 +14,7 @@ Provides both class-based and function-based APIs for flexibility.
 from .cmd import CommandRunner
 from .fetch import Fetch
 from .file import File
-from .process import Process
+from .process import Process, ProcRec
 from .system import System
 
 # Function-based API
@@ -27,10 +27,16 @@ from .functions import (
     # Fetch functions
     fetch_url,
     download_file,
+    fetch_urls,
+    download_files,
+    afetch_urls,
     # File functions
     read_file,
+    read_files,
     create_file,
+    create_files,
     replace_in_file,
+    copy_file,
     delete_file,
     list_files,
     # Process functions
@@ -52,6 +58,7 @@ __all__ = [
     "Fetch",
     "File",
     "Process",
+    "ProcRec",
     "System",
     # Functions - Command
     "execute_command",
@@ -61,10 +68,16 @@ __all__ = [
     # Functions - Fetch
     "fetch_url",
     "download_file",
+    "fetch_urls",
+    "download_files",
+    "afetch_urls",
     # Functions - File
     "read_file",
+    "read_files",
     "create_file",
+    "create_files",
     "replace_in_file",
+    "copy_file",
     "delete_file",
     "list_files",
     # Functions - Process
@@ -1,11 +1,31 @@
 import subprocess
 import os
+import re
+import shlex
+import locale
+import selectors
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 import tempfile
 import shutil
 
 
+_IS_WIN = os.name == 'nt'
+
+# Anything that needs a real shell: pipes, redirection, expansion, globbing, comments...
+_SHELL_SYNTAX_RE = re.compile(r'[|&;<>()$`\\*?\[\]{}~#\n\r]')
+
+# Shell builtins/keywords that must not be exec'd directly
+_SHELL_BUILTINS = frozenset({
+    '.', ':', '[', 'alias', 'bg', 'break', 'case', 'cd', 'command', 'continue',
+    'echo', 'eval', 'exec', 'exit', 'export', 'fg', 'for', 'hash', 'if', 'jobs',
+    'kill', 'local', 'printf', 'pwd', 'read', 'readonly', 'return', 'set',
+    'shift', 'source', 'test', 'times', 'trap', 'type', 'ulimit', 'umask',
+    'unalias', 'unset', 'wait', 'while',
+})
+
+
 class CommandRunner:
     """
     ⚠️ WARNING: For development/testing only, NOT for production use
@@ -21,13 +41,16 @@ class CommandRunner:
     - All operations restricted to workdir
     """
     
-    def __init__(self, workdir: Optional[str] = None, timeout: int = 60):
+    def __init__(self, workdir: Optional[str] = None, timeout: int = 60,
+                 max_output_bytes: Optional[int] = 10 * 1024 * 1024):
         """
         Args:
             workdir: Working directory, creates temp dir if None
             timeout: Command execution timeout in seconds
+            max_output_bytes: Max bytes kept per stream (stdout/stderr), None for unlimited
         """
         self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
         
         # Setup working directory
         if workdir:
@@ -38,6 +61,10 @@ class CommandRunner:
             self.workdir = Path(tempfile.mkdtemp(prefix="llm_cmd_"))
             self._is_temp = True
         
+        # Resolve workdir once for containment checks in read_file/write_file
+        self._root = str(self.workdir.resolve())
+        self._root_sep = os.path.join(self._root, '')
+        
         # System-level dangerous operation blacklist (only blocks obvious destructive commands)
         self.blocked_patterns = [
             'rm -rf /',
@@ -50,11 +77,93 @@ class CommandRunner:
             'mkfs',
             'fdisk',
         ]
+        
+        # Compile blacklist once so each check is a single case-insensitive scan
+        self._blocked_re = re.compile(
+            '|'.join(re.escape(pattern) for pattern in self.blocked_patterns),
+            re.IGNORECASE
+        )
     
     def _is_blocked(self, command: str) -> bool:
         """Check if command is obviously dangerous"""
-        cmd_lower = command.lower().strip()
-        return any(pattern in cmd_lower for pattern in self.blocked_patterns)
+        return self._blocked_re.search(command) is not None
+    
+    def _split_simple(self, command: str) -> Optional[List[str]]:
+        """
+        Split a simple command into argv so it can run without /bin/sh.
+        Returns None if the command needs a shell (POSIX only).
+        """
+        if _IS_WIN or _SHELL_SYNTAX_RE.search(command):
+            return None
+        try:
+            args = shlex.split(command)
+        except ValueError:
+            return None
+        if not args or '=' in args[0] or args[0] in _SHELL_BUILTINS:
+            return None
+        
+        # Only bypass the shell for programs found on PATH
+        # (explicit paths may be shebang-less scripts that sh would interpret)
+        if os.sep in args[0] or shutil.which(args[0]) is None:
+            return None
+        return args
+    
+    def _collect_output(self, proc: subprocess.Popen, timeout: float,
+                        input: Optional[bytes] = None) -> Tuple[bytearray, bytearray, bool]:
+        """
+        Drain stdout/stderr into bytearrays until the process closes them.
+        Returns (stdout, stderr, truncated). Raises subprocess.TimeoutExpired.
+        """
+        limit = self.max_output_bytes
+        
+        # Windows pipes can't be select()ed; stdin input also needs communicate()
+        if _IS_WIN or input is not None:
+            out, err = proc.communicate(input=input, timeout=timeout)
+            truncated = limit is not None and (len(out) > limit or len(err) > limit)
+            if truncated:
+                out, err = out[:limit], err[:limit]
+            return bytearray(out), bytearray(err), truncated
+        
+        deadline = time.monotonic() + timeout
+        buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+        truncated = False
+        
+        with selectors.DefaultSelector() as selector:
+            for pipe in buffers:
+                selector.register(pipe, selectors.EVENT_READ)
+            
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)
+                
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 64 * 1024)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    
+                    buf = buffers[key.fileobj]
+                    if limit is None:
+                        buf += chunk
+                        continue
+                    # Keep draining past the limit so the child never blocks on a full pipe
+                    room = limit - len(buf)
+                    if room > 0:
+                        buf += chunk[:room]
+                    if len(chunk) > room:
+                        truncated = True
+        
+        proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        return buffers[proc.stdout], buffers[proc.stderr], truncated
+    
+    @staticmethod
+    def _decode(data: bytearray) -> str:
+        """Decode captured output once, with text-mode newline handling"""
+        text = data.decode(locale.getpreferredencoding(False), errors='replace')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
     
     def execute(self, command: str, **kwargs) -> Dict[str, Any]:
         """
@@ -71,6 +180,7 @@ class CommandRunner:
                 'stdout': str,          # Standard output
                 'stderr': str,          # Standard error
                 'workdir': str,         # Working directory
+                'truncated': bool,      # Output exceeded max_output_bytes (only when truncated)
                 'error': str            # Error message (on failure only)
             }
         """
@@ -85,30 +195,50 @@ class CommandRunner:
                 'workdir': str(self.workdir)
             }
         
+        # Simple commands are exec'd directly, skipping one fork+exec of /bin/sh
+        args = None
+        if 'shell' not in kwargs and 'executable' not in kwargs:
+            args = self._split_simple(command)
+        
+        timeout = kwargs.pop('timeout', self.timeout)
+        input = kwargs.pop('input', None)
+        if isinstance(input, str):
+            input = input.encode(locale.getpreferredencoding(False))
+        
         try:
-            # Execute in working directory
-            result = subprocess.run(
-                command,
-                shell=True,
+            # Execute in working directory, capturing raw bytes
+            proc = subprocess.Popen(
+                args if args is not None else command,
+                shell=args is None,
                 cwd=str(self.workdir),
-                capture_output=True,
-                text=True,
-                timeout=kwargs.get('timeout', self.timeout),
-                **{k: v for k, v in kwargs.items() if k != 'timeout'}
+                stdin=subprocess.PIPE if input is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **kwargs
             )
+            with proc:
+                try:
+                    stdout, stderr, truncated = self._collect_output(proc, timeout, input)
+                except subprocess.TimeoutExpired:
+                    # Kill before Popen.__exit__ waits on the process
+                    proc.kill()
+                    raise
             
-            return {
-                'success': result.returncode == 0,
-                'returncode': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
+            result = {
+                'success': proc.returncode == 0,
+                'returncode': proc.returncode,
+                'stdout': self._decode(stdout),
+                'stderr': self._decode(stderr),
                 'workdir': str(self.workdir)
             }
+            if truncated:
+                result['truncated'] = True
+            return result
             
         except subprocess.TimeoutExpired:
             return {
                 'success': False,
-                'error': f'Command timeout after {self.timeout}s',
+                'error': f'Command timeout after {timeout}s',
                 'returncode': -1,
                 'stdout': '',
                 'stderr': '',
@@ -127,27 +257,37 @@ class CommandRunner:
     def list_files(self) -> list:
         """List files in working directory"""
         try:
-            return [f.name for f in self.workdir.iterdir()]
+            with os.scandir(self.workdir) as entries:
+                return [entry.name for entry in entries]
         except Exception:
             return []
     
+    def _resolve_in_workdir(self, filename: str) -> Optional[str]:
+        """Resolve filename inside workdir, None if it escapes"""
+        full = os.path.realpath(os.path.join(self._root, filename))
+        if full != self._root and not full.startswith(self._root_sep):
+            return None
+        return full
+    
     def read_file(self, filename: str) -> Optional[str]:
         """Read file content from working directory"""
         try:
-            file_path = self.workdir / filename
             # Ensure file is within workdir
-            file_path.resolve().relative_to(self.workdir.resolve())
-            return file_path.read_text()
+            file_path = self._resolve_in_workdir(filename)
+            if file_path is None:
+                return None
+            return Path(file_path).read_text()
         except Exception as e:
             return None
     
     def write_file(self, filename: str, content: str) -> bool:
         """Write file to working directory"""
         try:
-            file_path = self.workdir / filename
             # Ensure file is within workdir
-            file_path.resolve().relative_to(self.workdir.resolve())
-            file_path.write_text(content)
+            file_path = self._resolve_in_workdir(filename)
+            if file_path is None:
+                return False
+            Path(file_path).write_text(content)
             return True
         except Exception:
             return False
@@ -178,8 +318,8 @@ def demo():
         # Example: Simulate LLM-returned command sequence
         commands = [
             "echo 'Hello from LLM!' > test.txt",
-            "ls -la" if os.name != 'nt' else "dir",
-            "cat test.txt" if os.name != 'nt' else "type test.txt",
+            "dir" if _IS_WIN else "ls -la",
+            "type test.txt" if _IS_WIN else "cat test.txt",
             "python --version",
         ]
         
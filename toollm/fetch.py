@@ -1,8 +1,153 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error, ReadTimeoutError
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Iterable, Union
 from bs4 import BeautifulSoup
+from urllib.parse import urlparse, unquote
+import asyncio
+import codecs
+import contextlib
+import functools
+import itertools
+import json
 import mimetypes
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+# orjson parses straight from bytes and is several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Integers past 64 bits come back from orjson as lossy floats; any run of 19+
+# digits (even inside a string) sends the body to stdlib json instead
+_BIG_INT_RE = re.compile(rb'\d{19,}')
+
+
+def _json_loads(data: bytes, text: Callable[[], str]) -> Any:
+    """
+    Parse a JSON body, same result as json.loads on the decoded text
+    
+    Args:
+        data: Raw response body
+        text: Returns the body decoded with the response charset (only
+            called for the stdlib fallback)
+    
+    Returns:
+        Parsed JSON value. orjson is used for the common case; stdlib json
+        handles what orjson can't (non-UTF-8 bodies, NaN/Infinity, big ints).
+    """
+    if orjson is not None and not _BIG_INT_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text())
+
+# C-backed lxml parser is much faster than the pure-Python html.parser
+try:
+    from lxml import etree as _etree
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _etree = None
+    _HTML_PARSER = 'html.parser'
+
+# selectolax (lexbor) keeps the whole tree in C and is the fastest text extractor, but its
+# HTML5 tree building re-parents malformed markup (e.g. a <div> inside <p><noscript> ends up
+# outside the noscript), so its text can differ from lxml's. Used only when lxml is missing
+# or with TOOLLM_LEXBOR=1.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexborHTMLParser
+except ImportError:
+    _LexborHTMLParser = None
+_USE_LEXBOR = _LexborHTMLParser is not None and (_etree is None or os.environ.get('TOOLLM_LEXBOR') == '1')
+
+# Content-Type check without lowercasing the header (also matches xhtml)
+_HTML_CT_RE = re.compile(r'html', re.I)
+
+# Content-Disposition filename / RFC 5987 filename*=charset'lang'value
+_CD_RE = re.compile(
+    r'''filename\*\s*=\s*(?:([\w!#$%&+^`{}~-]+)'[^']*')?"?([^";]*)"?'''  # RFC 5987: charset'lang'value
+    r'''|filename\s*=\s*"?([^";]*)"?''',                                     # plain value, taken verbatim
+    re.I
+)
+
+# Load the mime.types database at import instead of inside the first download (where
+# concurrent threads would race the lazy init); keep any types the host app already added
+if not mimetypes.inited:
+    mimetypes.init()
+
+# Content-Type -> extension lookups repeat for every download from the same kind of source
+_guess_extension = functools.lru_cache(maxsize=256)(mimetypes.guess_extension)
+
+# Charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r'''charset\s*=\s*["']?([\w.:-]+)''', re.I)
+
+# <meta charset=...> / <meta http-equiv=... content="...; charset=..."> near the top of a document
+_META_CHARSET_RE = re.compile(rb'''<meta[^>]+charset\s*=\s*["']?([\w.:-]+)''', re.I)
+
+# Non-content tags whose text is dropped from extracted content
+_SKIP_TAGS = frozenset({'script', 'style', 'meta', 'link', 'noscript'})
+
+
+def _preallocate(f, headers) -> None:
+    """Reserve disk space for a download when its final size is known (best effort)"""
+    # Content-Length is the encoded size, so only trust it for identity transfers
+    if not hasattr(os, 'posix_fallocate') or headers.get('Content-Encoding', 'identity') != 'identity':
+        return
+    try:
+        size = int(headers.get('Content-Length') or 0)
+        if size > 0:
+            os.posix_fallocate(f.fileno(), 0, size)
+    except (ValueError, OSError):  # Bad header, or filesystem without fallocate support
+        pass
+
+
+def _write_chunks(f, chunks: list) -> None:
+    """Write buffered chunks in order, with a single writev() where available (no join copy)"""
+    if not hasattr(os, 'writev'):
+        f.write(b''.join(chunks))
+        return
+    fd = f.fileno()
+    written = os.writev(fd, chunks)
+    if written < sum(map(len, chunks)):  # Rare partial write: finish the remainder
+        rest = memoryview(b''.join(chunks))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+
+def _declared_charset(content_type: str) -> Optional[str]:
+    """Charset named by a Content-Type header, None if absent or unknown to Python"""
+    m = _CHARSET_RE.search(content_type)
+    if m:
+        try:
+            codecs.lookup(m.group(1))
+            return m.group(1)
+        except LookupError:
+            pass
+    return None
+
+
+def _sniff_charset(head: bytes, declared: Optional[str] = None) -> Optional[str]:
+    """Document charset: a BOM wins, then the header's declared charset, then a <meta> tag"""
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if declared:
+        return declared
+    m = _META_CHARSET_RE.search(head, 0, 2048)
+    return _declared_charset('charset=' + m.group(1).decode('ascii')) if m else None
+
+
+def _clean_whitespace(text: str) -> str:
+    """Strip every line and drop blank ones (map/filter keep the loop in C)"""
+    return '\n'.join(filter(None, map(str.strip, text.splitlines())))
 
 
 class Fetch:
@@ -20,20 +165,47 @@ class Fetch:
     - Cross-platform compatible
     """
     
-    def __init__(self, workdir: str, timeout: int = 30):
+    def __init__(self, workdir: Optional[str] = None, timeout: int = 30,
+                 download_chunk_size: int = 128 * 1024):
         """
         Args:
-            workdir: Working directory for downloaded files
+            workdir: Working directory for downloaded files. If None, a temp dir is created on
+                     first download and removed (with its files) by close()/aclose()
             timeout: Request timeout in seconds
+            download_chunk_size: Bytes read per iteration when streaming downloads
         """
-        self.workdir = Path(workdir).absolute()
         self.timeout = timeout
-        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.download_chunk_size = download_chunk_size
         
-        # Default headers to avoid basic blocking
+        # get() never touches disk, so without a workdir none is created until a download
+        self.workdir: Optional[Path] = None
+        self._owns_workdir = False  # True once we created a temp workdir that close() removes
+        self._workdir_lock = threading.Lock()
+        self._active_downloads: set = set()  # Paths currently being written, see _claim_download_path
+        self._held_downloads: set = set()    # Finished paths kept reserved until a batch ends
+        self._batch_depth = 0
+        if workdir:
+            self._set_workdir(Path(workdir).absolute())
+        
+        # Persistent session: keep-alive and connection pooling across calls
+        self.session = requests.Session()
+        
+        # Default headers to avoid basic blocking; merged into every request (sync, async
+        # and HTTP/2), so later edits to self.headers apply to all of them
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # aiohttp session for aget/adownload, created on first async call
+        self._asession = None
+        
+        # Opt-in HTTP/2 client for get(): many requests to one host share a single
+        # multiplexed connection (TOOLLM_HTTP2=1, requires httpx[http2])
+        self._h2_client = self._create_http2_client() if os.environ.get('TOOLLM_HTTP2') == '1' else None
     
     def get(self, url: str, format: str = 'content', headers: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -63,20 +235,22 @@ class Fetch:
                 'error': f"Invalid format: {format}. Must be 'content', 'raw', or 'json'"
             }
         
+        if self._h2_client is not None:
+            return self._get_http2(url, format, headers)
+        
         try:
-            # Merge headers
-            request_headers = {**self.headers, **(headers or {})}
-            
-            # Make request
-            response = requests.get(url, headers=request_headers, timeout=self.timeout)
+            # Make request (body streamed into the HTML parser for 'content')
+            response = self.session.get(url, headers=self._request_headers(headers), timeout=self.timeout,
+                                        stream=format == 'content')
             response.raise_for_status()
+            content_type = response.headers.get('Content-Type', 'unknown')
             
             # Process based on format
             if format == 'json':
                 content = self._parse_json(response)
-            elif format == 'content':
+            elif format == 'content' and _HTML_CT_RE.search(content_type):
                 content = self._extract_content(response)
-            else:  # raw
+            else:  # raw, or non-HTML content
                 content = response.text
             
             return {
@@ -84,7 +258,7 @@ class Fetch:
                 'content': content,
                 'url': response.url,
                 'status_code': response.status_code,
-                'content_type': response.headers.get('Content-Type', 'unknown')
+                'content_type': content_type
             }
             
         except requests.exceptions.Timeout:
@@ -102,6 +276,11 @@ class Fetch:
                 'success': False,
                 'error': f'Request error: {str(e)}'
             }
+        except json.JSONDecodeError as e:
+            return {
+                'success': False,
+                'error': f'Invalid JSON: {str(e)}'
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -128,37 +307,33 @@ class Fetch:
             }
         """
         try:
-            # Merge headers
-            request_headers = {**self.headers, **(headers or {})}
-            
             # Make request with streaming
-            response = requests.get(url, headers=request_headers, 
-                                  timeout=self.timeout, stream=True)
+            response = self.session.get(url, headers=self._request_headers(headers),
+                                        timeout=self.timeout, stream=True)
             response.raise_for_status()
             
             # Determine filename
             if not filename:
                 filename = self._get_filename_from_response(response, url)
             
-            # Validate path
-            file_path = self.workdir / filename
-            try:
-                file_path.resolve().relative_to(self.workdir.resolve())
-            except ValueError:
+            # Validate path (and reserve it against concurrent downloads of the same name)
+            file_path = self._claim_download_path(filename)
+            if file_path is None:
                 return {
                     'success': False,
                     'error': f'Invalid filename: {filename} (outside workdir)'
                 }
             
-            # Download file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            size = 0
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        size += len(chunk)
+            # Copy straight from the urllib3 stream (still gunzipped/inflated as needed)
+            response.raw.decode_content = True
+            try:
+                with open(file_path, 'wb') as f:
+                    _preallocate(f, response.headers)
+                    shutil.copyfileobj(response.raw, f, self.download_chunk_size)
+                    size = f.tell()
+                    f.truncate()  # Drop any unused preallocated tail
+            finally:
+                self._release_download_path(file_path)
             
             return {
                 'success': True,
@@ -167,7 +342,7 @@ class Fetch:
                 'content_type': response.headers.get('Content-Type', 'unknown')
             }
             
-        except requests.exceptions.Timeout:
+        except (requests.exceptions.Timeout, ReadTimeoutError):
             return {
                 'success': False,
                 'error': f'Download timeout after {self.timeout}s'
@@ -177,7 +352,7 @@ class Fetch:
                 'success': False,
                 'error': f'HTTP error: {e.response.status_code} {e.response.reason}'
             }
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, Urllib3Error) as e:
             return {
                 'success': False,
                 'error': f'Download error: {str(e)}'
@@ -188,44 +363,449 @@ class Fetch:
                 'error': f'Unexpected error: {str(e)}'
             }
     
+    async def aget(self, url: str, format: str = 'content',
+                   headers: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Async version of get(), for fetching many URLs concurrently (requires aiohttp)
+        
+        Args/Returns: same as get()
+        """
+        if format not in ['content', 'raw', 'json']:
+            return {
+                'success': False,
+                'error': f"Invalid format: {format}. Must be 'content', 'raw', or 'json'"
+            }
+        
+        try:
+            import aiohttp
+        except ImportError:
+            return {
+                'success': False,
+                'error': 'aiohttp is required for async fetch: pip install toollm[async]'
+            }
+        
+        try:
+            session = self._get_async_session()
+            async with session.get(url, headers=self._request_headers(headers)) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', 'unknown')
+                
+                # Process based on format
+                if format == 'json':
+                    data = await response.read()
+                    content = _json_loads(data, lambda: data.decode(response.get_encoding()))
+                elif format == 'content' and _HTML_CT_RE.search(content_type):
+                    content = self._html_to_text(await response.read(), _declared_charset(content_type))
+                else:  # raw, or non-HTML content
+                    content = await response.text()
+                
+                return {
+                    'success': True,
+                    'content': content,
+                    'url': str(response.url),
+                    'status_code': response.status,
+                    'content_type': content_type
+                }
+        
+        except asyncio.TimeoutError:
+            return {
+                'success': False,
+                'error': f'Request timeout after {self.timeout}s'
+            }
+        except aiohttp.ClientResponseError as e:
+            return {
+                'success': False,
+                'error': f'HTTP error: {e.status} {e.message}'
+            }
+        except aiohttp.ClientError as e:
+            return {
+                'success': False,
+                'error': f'Request error: {str(e)}'
+            }
+        except json.JSONDecodeError as e:
+            return {
+                'success': False,
+                'error': f'Invalid JSON: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
+    
+    async def adownload(self, url: str, filename: Optional[str] = None,
+                        headers: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Async version of download(), for downloading many files concurrently (requires aiohttp)
+        
+        Args/Returns: same as download()
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            return {
+                'success': False,
+                'error': 'aiohttp is required for async fetch: pip install toollm[async]'
+            }
+        
+        try:
+            session = self._get_async_session()
+            async with session.get(url, headers=self._request_headers(headers)) as response:
+                response.raise_for_status()
+                
+                # Determine filename
+                if not filename:
+                    filename = self._get_filename_from_response(response, url)
+                
+                # Validate path (and reserve it against concurrent downloads of the same name)
+                file_path = self._claim_download_path(filename)
+                if file_path is None:
+                    return {
+                        'success': False,
+                        'error': f'Invalid filename: {filename} (outside workdir)'
+                    }
+                
+                # Disk writes go to the default executor so the event loop keeps serving.
+                # Network chunks are often small, so they are coalesced into one
+                # writev() per download_chunk_size bytes (one executor hop, one syscall)
+                loop = asyncio.get_running_loop()
+                size = 0
+                pending, pending_size = [], 0
+                try:
+                    f = await loop.run_in_executor(None, open, file_path, 'wb', 0)
+                    try:
+                        await loop.run_in_executor(None, _preallocate, f, response.headers)
+                        async for chunk in response.content.iter_chunked(self.download_chunk_size):
+                            pending.append(chunk)
+                            pending_size += len(chunk)
+                            if pending_size >= self.download_chunk_size or len(pending) >= 512:
+                                await loop.run_in_executor(None, _write_chunks, f, pending)
+                                size += pending_size
+                                pending, pending_size = [], 0
+                        if pending:
+                            await loop.run_in_executor(None, _write_chunks, f, pending)
+                            size += pending_size
+                        await loop.run_in_executor(None, f.truncate)
+                    finally:
+                        await loop.run_in_executor(None, f.close)
+                finally:
+                    self._release_download_path(file_path)
+                
+                return {
+                    'success': True,
+                    'file_path': str(file_path),
+                    'size': size,
+                    'content_type': response.headers.get('Content-Type', 'unknown')
+                }
+        
+        except asyncio.TimeoutError:
+            return {
+                'success': False,
+                'error': f'Download timeout after {self.timeout}s'
+            }
+        except aiohttp.ClientResponseError as e:
+            return {
+                'success': False,
+                'error': f'HTTP error: {e.status} {e.message}'
+            }
+        except aiohttp.ClientError as e:
+            return {
+                'success': False,
+                'error': f'Download error: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
+    
+    def _create_http2_client(self):
+        """Create the httpx HTTP/2 client, None if httpx/h2 are not installed"""
+        try:
+            import httpx
+            return httpx.Client(
+                http2=True,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
+        except ImportError:
+            return None
+    
+    def _get_http2(self, url: str, format: str, headers: Optional[Dict]) -> Dict[str, Any]:
+        """get() over the httpx HTTP/2 client (same return format)"""
+        import httpx
+        
+        try:
+            # Connection-specific headers are not allowed in HTTP/2
+            request_headers = {k: v for k, v in self._request_headers(headers).items()
+                               if k.lower() != 'connection'}
+            response = self._h2_client.get(url, headers=request_headers)
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', 'unknown')
+            
+            # Process based on format
+            if format == 'json':
+                content = _json_loads(response.content, lambda: response.text)
+            elif format == 'content' and _HTML_CT_RE.search(content_type):
+                content = self._html_to_text(response.content, _declared_charset(content_type))
+            else:  # raw, or non-HTML content
+                content = response.text
+            
+            return {
+                'success': True,
+                'content': content,
+                'url': str(response.url),
+                'status_code': response.status_code,
+                'content_type': content_type
+            }
+        
+        except httpx.TimeoutException:
+            return {
+                'success': False,
+                'error': f'Request timeout after {self.timeout}s'
+            }
+        except httpx.HTTPStatusError as e:
+            return {
+                'success': False,
+                'error': f'HTTP error: {e.response.status_code} {e.response.reason_phrase}'
+            }
+        except httpx.HTTPError as e:
+            return {
+                'success': False,
+                'error': f'Request error: {str(e)}'
+            }
+        except json.JSONDecodeError as e:
+            return {
+                'success': False,
+                'error': f'Invalid JSON: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
+    
+    def _request_headers(self, headers: Optional[Dict]) -> Dict[str, str]:
+        """Default headers merged with per-call headers (per-call wins)"""
+        return {**self.headers, **headers} if headers else self.headers
+    
+    def _get_async_session(self):
+        """Get (or lazily create) the aiohttp session"""
+        import aiohttp
+        if self._asession is None or self._asession.closed:
+            # Per connect/read timeouts like requests: a total deadline would cut off
+            # large downloads that are still making progress
+            self._asession = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout),
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+            )
+        return self._asession
+    
+    def _set_workdir(self, workdir: Path):
+        """Create workdir and cache its resolved form"""
+        workdir.mkdir(parents=True, exist_ok=True)
+        # Resolve workdir once, download path checks only need a prefix comparison
+        self._root = os.path.realpath(workdir)
+        self._root_sep = os.path.join(self._root, '')
+        self.workdir = workdir
+    
+    def _resolve_download_path(self, filename: str) -> Optional[Path]:
+        """Resolve download target inside workdir (parents created), None if it escapes"""
+        if self.workdir is None:
+            with self._workdir_lock:
+                if self.workdir is None:
+                    self._set_workdir(Path(tempfile.mkdtemp(prefix="fetch_")))
+                    self._owns_workdir = True
+        
+        file_path = self.workdir / filename
+        full = os.path.realpath(file_path)
+        # Security check: ensure path is within workdir (no exception on denial)
+        if not (full == self._root or full.startswith(self._root_sep)):
+            return None
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return file_path
+    
+    def _claim_download_path(self, filename: str) -> Optional[Path]:
+        """
+        Resolve download target like _resolve_download_path and reserve it until
+        _release_download_path. A path another download is still writing gets a
+        _1, _2, ... suffix, so concurrent downloads never share a file.
+        """
+        file_path = self._resolve_download_path(filename)
+        if file_path is None:
+            return None
+        
+        with self._workdir_lock:
+            candidate, n = file_path, 1
+            while candidate in self._active_downloads:
+                candidate = file_path.with_name(f'{file_path.stem}_{n}{file_path.suffix}')
+                n += 1
+            self._active_downloads.add(candidate)
+        return candidate
+    
+    def _release_download_path(self, file_path: Path):
+        """Drop a reservation made by _claim_download_path (deferred inside _download_batch)"""
+        with self._workdir_lock:
+            if self._batch_depth:
+                self._held_downloads.add(file_path)
+            else:
+                self._active_downloads.discard(file_path)
+    
+    @contextlib.contextmanager
+    def _download_batch(self):
+        """
+        Keep paths claimed inside the block reserved until it exits, so downloads in
+        one batch never reuse a name, even when they do not overlap in time
+        """
+        with self._workdir_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._workdir_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._active_downloads -= self._held_downloads
+                    self._held_downloads.clear()
+    
     def _extract_content(self, response: requests.Response) -> str:
-        """Extract clean text content from HTML response"""
-        content_type = response.headers.get('Content-Type', '').lower()
+        """Extract clean text content from HTML response (caller checks Content-Type)"""
+        # Parsers take the raw bytes: no response.text decode (or requests' charset
+        # guessing), and without a header charset they sniff <meta charset> themselves
+        encoding = _declared_charset(response.headers.get('Content-Type', ''))
+        if _USE_LEXBOR or _etree is None:
+            return self._html_to_text(response.content, encoding)
+        
+        # Feed the body to the parser as it arrives
+        return self._html_to_text(response.iter_content(chunk_size=65536), encoding)
+    
+    def _html_to_text(self, source: Union[str, bytes, Iterable], encoding: Optional[str] = None) -> str:
+        """
+        Extract clean text from an HTML document (str, bytes, or an iterable of chunks)
+        
+        encoding is the charset declared by the server for byte input. Without it the
+        document's own <meta> charset is used, falling back to UTF-8.
+        
+        With lxml the document is parsed incrementally and text is collected in one
+        pass, without building a full tree or a second get_text() copy. Complete
+        strings go to selectolax instead when lxml is missing or TOOLLM_LEXBOR=1.
+        """
+        if _USE_LEXBOR and isinstance(source, (str, bytes)):
+            return self._lexbor_to_text(source, encoding)
+        if _etree is None:
+            if not isinstance(source, (str, bytes)):
+                chunks = list(source)
+                source = chunks[0][:0].join(chunks) if chunks else ''
+            return self._soup_to_text(source, encoding)
+        
+        chunks = iter((source,) if isinstance(source, (str, bytes)) else source)
+        first = next(chunks, b'')
+        if isinstance(first, bytes):
+            encoding = _sniff_charset(first, encoding) or 'utf-8'
+        
+        parser = None
+        if encoding and isinstance(first, bytes):
+            # libxml2 knows most IANA names, and Python's canonical spelling of the rest
+            canonical = codecs.lookup(encoding).name
+            for name in (encoding, canonical, canonical.replace('_', '-')):
+                try:
+                    parser = _etree.HTMLPullParser(events=('start', 'end'), remove_comments=True,
+                                                   remove_pis=True, encoding=name)
+                    break
+                except LookupError:
+                    pass
+        if parser is None:
+            parser = _etree.HTMLPullParser(events=('start', 'end'), remove_comments=True, remove_pis=True)
+        parts = []
+        skip_depth = 0
+        
+        def drain():
+            nonlocal skip_depth
+            for event, el in parser.read_events():
+                if event == 'start':
+                    # Text between the previous node and this one is complete now
+                    prev = el.getprevious()
+                    if prev is not None:
+                        text = prev.tail
+                    else:
+                        parent = el.getparent()
+                        text = parent.text if parent is not None else None
+                    if text and not skip_depth:
+                        parts.append(text)
+                    if el.tag in _SKIP_TAGS:
+                        skip_depth += 1
+                else:
+                    # Trailing text inside this element
+                    text = el[-1].tail if len(el) else el.text
+                    if text and not skip_depth:
+                        parts.append(text)
+                    if el.tag in _SKIP_TAGS:
+                        skip_depth -= 1
+                    # Free finished subtrees; keep the tail for the next sibling
+                    el.clear(keep_tail=True)
+                    while el.getprevious() is not None:
+                        del el.getparent()[0]
         
-        # If not HTML, return raw text
-        if 'html' not in content_type:
-            return response.text
+        for chunk in itertools.chain((first,), chunks):
+            if chunk:
+                parser.feed(chunk)
+                drain()
+        try:
+            parser.close()
+        except _etree.XMLSyntaxError:  # Empty document
+            pass
+        drain()
         
-        # Parse HTML and extract text
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return _clean_whitespace('\n'.join(parts))
+    
+    def _lexbor_to_text(self, html: Union[str, bytes], encoding: Optional[str] = None) -> str:
+        """Extract clean text with selectolax; only the final text crosses into Python"""
+        # lexbor reads bytes as UTF-8, so only other declared charsets need decoding first
+        if isinstance(html, bytes):
+            encoding = _sniff_charset(html, encoding)
+            if encoding and codecs.lookup(encoding).name != 'utf-8':
+                html = html.decode(encoding, 'replace')
+        tree = _LexborHTMLParser(html)
+        tree.strip_tags(list(_SKIP_TAGS))
+        return _clean_whitespace(tree.root.text(separator='\n')) if tree.root is not None else ''
+    
+    def _soup_to_text(self, html: Union[str, bytes], encoding: Optional[str] = None) -> str:
+        """Extract clean text with BeautifulSoup (fallback when lxml is unavailable)"""
+        if isinstance(html, bytes):
+            encoding = _sniff_charset(html, encoding)
+            if encoding:
+                html = html.decode(encoding, 'replace')
+        soup = BeautifulSoup(html, _HTML_PARSER)
         
         # Remove script, style, and other non-content tags
-        for tag in soup(['script', 'style', 'meta', 'link', 'noscript']):
+        for tag in soup(_SKIP_TAGS):
             tag.decompose()
         
         # Get text
         text = soup.get_text(separator='\n')
         
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        text = '\n'.join(line for line in lines if line)
-        
-        return text
+        return _clean_whitespace(text)
     
     def _parse_json(self, response: requests.Response) -> Any:
-        """Parse JSON response"""
-        return response.json()
+        """Parse JSON response (from raw bytes; text is decoded only for the fallback)"""
+        return _json_loads(response.content, lambda: response.text)
     
     def _get_filename_from_response(self, response: requests.Response, url: str) -> str:
         """Extract filename from response or URL"""
-        # Try Content-Disposition header
+        # Try Content-Disposition header (filename* takes precedence over filename)
         content_disposition = response.headers.get('Content-Disposition', '')
-        if 'filename=' in content_disposition:
-            filename = content_disposition.split('filename=')[1].strip('"\'')
-            return filename
+        if 'filename' in content_disposition:
+            plain = None
+            for charset, ext_value, plain_value in _CD_RE.findall(content_disposition):
+                ext_value = ext_value.strip()
+                if ext_value:
+                    return unquote(ext_value, encoding=charset or 'utf-8', errors='replace')
+                plain = plain or plain_value.strip()
+            if plain:
+                return plain
         
         # Extract from URL
-        from urllib.parse import urlparse, unquote
         parsed = urlparse(url)
         filename = Path(unquote(parsed.path)).name
         
@@ -236,12 +816,43 @@ class Fetch:
             # Try to add extension from content-type
             content_type = response.headers.get('Content-Type', '')
             if content_type:
-                ext = mimetypes.guess_extension(content_type.split(';')[0])
+                ext = _guess_extension(content_type.split(';')[0].strip())
                 if ext:
                     filename += ext
         
         return filename or 'download'
     
+    def close(self):
+        """Close the HTTP session(s) and their pooled connections, and remove our temp workdir"""
+        self.session.close()
+        if self._h2_client is not None:
+            self._h2_client.close()
+        
+        with self._workdir_lock:
+            if self._owns_workdir:
+                shutil.rmtree(self.workdir, ignore_errors=True)
+                self.workdir = None
+                self._owns_workdir = False
+    
+    async def aclose(self):
+        """Close both the sync and the async HTTP sessions"""
+        self.close()
+        if self._asession is not None:
+            await self._asession.close()
+            self._asession = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
     def __repr__(self):
         return f"<Fetch workdir={self.workdir}>"
 
@@ -303,6 +914,7 @@ def demo():
     print(f"   Result: {result}\n")
     
     # Cleanup
+    fetch.close()
     shutil.rmtree(temp_dir)
     print("Demo completed. Temp directory cleaned.")
 
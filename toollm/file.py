@@ -1,9 +1,32 @@
 import os
+import stat
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+import re
 import shutil
 
 
+# Temp files for atomic writes: created with 0666 so the process umask applies as it
+# would to a normal open() (mkstemp forces 0600); O_BINARY matters on Windows only
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Large str content is encoded/written in slices to avoid a full-size bytes copy
+_WRITE_CHUNK_CHARS = 256 * 1024
+
+# Upper bound for the single-pass replace path (independence check is O(n^2))
+_COMBINED_REPLACE_MAX = 64
+
+
+def _can_overlap(a, b) -> bool:
+    """Check if two strings could share characters when placed next to/inside each other"""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k])
+               for k in range(1, min(len(a), len(b))))
+
+
 class File:
     """
     ⚠️ WARNING: For development/testing only, NOT for production use
@@ -19,12 +42,12 @@ class File:
     - Cross-platform compatible
     """
     
-    SUPPORTED_TEXT_EXTENSIONS = {
+    SUPPORTED_TEXT_EXTENSIONS = frozenset({
         '.txt', '.py', '.js', '.ts', '.jsx', '.tsx', '.md', '.json', 
         '.yaml', '.yml', '.html', '.css', '.scss', '.sh', '.bat', 
         '.csv', '.log', '.xml', '.sql', '.env', '.ini', '.cfg',
         '.java', '.cpp', '.c', '.h', '.go', '.rs', '.php', '.rb'
-    }
+    })
     
     def __init__(self, workdir: str):
         """
@@ -34,23 +57,105 @@ class File:
         self.workdir = Path(workdir).absolute()
         if not self.workdir.exists():
             self.workdir.mkdir(parents=True, exist_ok=True)
+        
+        # Resolve workdir once, path checks only need a prefix comparison
+        self._root = str(self.workdir.resolve())
+        self._root_sep = os.path.join(self._root, '')
+        
+        # Thread pool for batch operations, created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
     
-    def _validate_path(self, file_path: str) -> tuple[bool, Optional[Path]]:
+    def _validate_path(self, file_path: str) -> tuple[bool, Optional[str]]:
         """
         Validate file path is within workdir
         Returns: (is_valid, resolved_path)
         """
+        # Resolved on every call: a cached result could miss a symlink created since
+        full = os.path.realpath(os.path.join(self._root, file_path))
+        # Security check: ensure path is within workdir (no exception on denial)
+        ok = full == self._root or full.startswith(self._root_sep)
+        return ok, (full if ok else None)
+    
+    @staticmethod
+    def _stat(full_path: str) -> Optional[os.stat_result]:
+        """Single stat call covering exists/is_file/is_dir, None if missing"""
         try:
-            full_path = (self.workdir / file_path).resolve()
-            # Security check: ensure path is within workdir
-            full_path.relative_to(self.workdir)
-            return True, full_path
-        except (ValueError, RuntimeError):
-            return False, None
-    
-    def _is_text_file(self, file_path: Path) -> bool:
+            return os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+    
+    def _is_text_file(self, file_path: str) -> bool:
         """Check if file extension is supported text type"""
-        return file_path.suffix.lower() in self.SUPPORTED_TEXT_EXTENSIONS
+        suffix = os.path.splitext(file_path)[1]
+        # Extensions are almost always lowercase already, only lower() on a miss
+        return (suffix in self.SUPPORTED_TEXT_EXTENSIONS
+                or suffix.lower() in self.SUPPORTED_TEXT_EXTENSIONS)
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get (or lazily create) the thread pool for batch operations"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 4) * 4),
+                thread_name_prefix="toollm_file"
+            )
+        return self._pool
+    
+    def _map(self, fn, items: List[Any]) -> List[Any]:
+        """Apply fn to items on the thread pool, inline for single-item batches"""
+        if len(items) < 2:
+            return [fn(item) for item in items]
+        return list(self._get_pool().map(fn, items))
+    
+    def _atomic_write(self, full_path: str, content: Union[str, bytes]):
+        """
+        Write content via a temp file in the same directory + os.replace,
+        so readers never see a partially written file.
+        str is written as UTF-8 text, bytes are written as-is.
+        """
+        directory = os.path.dirname(full_path)
+        suffix = os.path.splitext(full_path)[1]
+        while True:
+            tmp_path = os.path.join(directory, f'.tmp_{os.urandom(6).hex()}{suffix}')
+            try:
+                fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            if isinstance(content, bytes):
+                f = os.fdopen(fd, 'wb')
+            else:
+                f = os.fdopen(fd, 'w', encoding='utf-8')
+            with f:
+                if isinstance(content, str) and len(content) > _WRITE_CHUNK_CHARS:
+                    for start in range(0, len(content), _WRITE_CHUNK_CHARS):
+                        f.write(content[start:start + _WRITE_CHUNK_CHARS])
+                else:
+                    f.write(content)
+            # New files already got the umask at creation; keep an existing file's mode
+            try:
+                shutil.copymode(full_path, tmp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _count_lines(self, f) -> int:
+        """Count remaining lines of a universal-newline text file in chunks (no line list)"""
+        total = 0
+        last = ''
+        for chunk in iter(lambda: f.read(1024 * 1024), ''):
+            total += chunk.count('\n')
+            last = chunk
+        # Last line without trailing newline still counts
+        if last and not last.endswith('\n'):
+            total += 1
+        return total
     
     def read_file(self, file_path: str, start_line: Optional[int] = None, 
                   end_line: Optional[int] = None) -> Dict[str, Any]:
@@ -78,37 +183,59 @@ class File:
                 'error': f'Invalid path: {file_path} (outside workdir)'
             }
         
-        if not full_path.exists():
+        st = self._stat(full_path)
+        if st is None:
             return {
                 'success': False,
                 'error': f'File not found: {file_path}'
             }
         
+        if not stat.S_ISREG(st.st_mode):
+            return {
+                'success': False,
+                'error': f'Path is not a file: {file_path}'
+            }
+        
         if not self._is_text_file(full_path):
             return {
                 'success': False,
-                'error': f'Unsupported file type: {full_path.suffix}. Only text files supported.'
+                'error': f'Unsupported file type: {os.path.splitext(full_path)[1]}. Only text files supported.'
             }
         
         try:
-            content = full_path.read_text(encoding='utf-8')
-            lines = content.splitlines(keepends=True)
-            total_lines = len(lines)
-            
-            # Apply line range if specified
             if start_line is not None and end_line is not None:
+                # Line range: one pass, no full-file string; universal newlines like
+                # the full read, so CR-only and CRLF files split into the same lines
+                with open(full_path, 'r', encoding='utf-8', newline=None) as f:
+                    lines = []
+                    if 1 <= start_line <= end_line:
+                        lines = list(islice(f, start_line - 1, end_line))
+                    
+                    if lines and len(lines) == end_line - start_line + 1:
+                        # Range fully present, just count what's left after it
+                        total_lines = end_line + self._count_lines(f)
+                    else:
+                        f.seek(0)
+                        total_lines = self._count_lines(f)
+                
                 if start_line < 1 or end_line > total_lines:
                     return {
                         'success': False,
                         'error': f'Line range out of bounds: {start_line}-{end_line} (total: {total_lines})'
                     }
-                lines = lines[start_line-1:end_line]
+                
                 content = ''.join(lines)
+            else:
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                total_lines = content.count('\n')
+                if content and not content.endswith('\n'):
+                    total_lines += 1
             
             return {
                 'success': True,
                 'content': content,
-                'file_path': str(full_path),
+                'file_path': full_path,
                 'total_lines': total_lines
             }
         except Exception as e:
@@ -139,7 +266,7 @@ class File:
                 'error': f'Invalid path: {file_path}'
             }
         
-        if full_path.exists():
+        if self._stat(full_path) is not None:
             return {
                 'success': False,
                 'error': f'File already exists: {file_path}'
@@ -148,17 +275,17 @@ class File:
         if not self._is_text_file(full_path):
             return {
                 'success': False,
-                'error': f'Unsupported file type: {full_path.suffix}'
+                'error': f'Unsupported file type: {os.path.splitext(full_path)[1]}'
             }
         
         try:
             # Create parent directories if needed
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding='utf-8')
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            self._atomic_write(full_path, content)
             
             return {
                 'success': True,
-                'file_path': str(full_path)
+                'file_path': full_path
             }
         except Exception as e:
             return {
@@ -196,55 +323,103 @@ class File:
                 'error': f'Invalid path: {file_path}'
             }
         
-        if not full_path.exists():
+        # Validate all replacements up front so bad input never touches the file
+        for idx, replacement in enumerate(replacements):
+            original = replacement.get('original_text')
+            new_text = replacement.get('new_text')
+            
+            if original is None or new_text is None:
+                return {
+                    'success': False,
+                    'error': f'Replacement {idx}: missing original_text or new_text'
+                }
+            
+            if not original:
+                return {
+                    'success': False,
+                    'error': f'Replacement {idx}: original_text is empty'
+                }
+            
+            if original == new_text:
+                return {
+                    'success': False,
+                    'error': f'Replacement {idx}: original_text and new_text are identical'
+                }
+        
+        st = self._stat(full_path)
+        if st is None:
             return {
                 'success': False,
                 'error': f'File not found: {file_path}'
             }
         
+        if not stat.S_ISREG(st.st_mode):
+            return {
+                'success': False,
+                'error': f'Path is not a file: {file_path}'
+            }
+        
         try:
-            content = full_path.read_text(encoding='utf-8')
+            with open(full_path, 'rb') as f:
+                content = f.read()
+            # CR/CRLF files keep universal-newline text handling ('\n' in search text);
+            # everything else is edited as raw UTF-8 bytes, skipping decode/encode
+            text_mode = b'\r' in content
+            if text_mode:
+                content = content.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
             replacements_made = 0
             
-            for idx, replacement in enumerate(replacements):
-                original = replacement.get('original_text')
-                new_text = replacement.get('new_text')
-                replace_all = replacement.get('replace_all', False)
-                
-                if original is None or new_text is None:
-                    return {
-                        'success': False,
-                        'error': f'Replacement {idx}: missing original_text or new_text'
-                    }
-                
-                if original == new_text:
+            ops = []
+            for replacement in replacements:
+                original = replacement['original_text']
+                new_text = replacement['new_text']
+                if not text_mode:
+                    original = original.encode('utf-8')
+                    new_text = new_text.encode('utf-8')
+                ops.append((original, new_text, replacement.get('replace_all', False)))
+            
+            if self._replacements_independent(ops):
+                content, replacements_made, error = self._replace_combined(content, ops)
+                if error:
                     return {
                         'success': False,
-                        'error': f'Replacement {idx}: original_text and new_text are identical'
+                        'error': error
                     }
+                ops = []
+            
+            for idx, (original, new_text, replace_all) in enumerate(ops):
+                if replace_all:
+                    # split/join counts and replaces in a single scan
+                    parts = content.split(original)
+                    count = len(parts) - 1
+                    if count == 0:
+                        return {
+                            'success': False,
+                            'error': f'Replacement {idx}: original_text not found in file'
+                        }
+                    content = new_text.join(parts)
+                    replacements_made += count
+                    continue
                 
-                count = content.count(original)
-                
-                if count == 0:
+                pos = content.find(original)
+                if pos < 0:
                     return {
                         'success': False,
                         'error': f'Replacement {idx}: original_text not found in file'
                     }
                 
-                if not replace_all and count > 1:
+                end = pos + len(original)
+                if content.find(original, end) >= 0:
+                    count = content.count(original)
                     return {
                         'success': False,
                         'error': f'Replacement {idx}: original_text appears {count} times (not unique). Set replace_all=true or make original_text more specific.'
                     }
                 
-                if replace_all:
-                    content = content.replace(original, new_text)
-                    replacements_made += count
-                else:
-                    content = content.replace(original, new_text, 1)
-                    replacements_made += 1
+                content = content[:pos] + new_text + content[end:]
+                replacements_made += 1
             
-            full_path.write_text(content, encoding='utf-8')
+            self._atomic_write(full_path, content)
             
             return {
                 'success': True,
@@ -256,6 +431,120 @@ class File:
                 'error': f'Replace error: {str(e)}'
             }
     
+    def copy_file(self, source_path: str, dest_path: str) -> Dict[str, Any]:
+        """
+        Copy file within workdir (kernel-side copy where the OS supports it)
+        
+        Args:
+            source_path: Relative path of existing file
+            dest_path: Relative path of new file (must not exist)
+            
+        Returns:
+            {
+                'success': bool,
+                'file_path': str,        # Full path of the copy
+                'size': int,             # Bytes copied
+                'error': str
+            }
+        """
+        src_valid, src_full = self._validate_path(source_path)
+        dst_valid, dst_full = self._validate_path(dest_path)
+        if not src_valid or not dst_valid:
+            return {
+                'success': False,
+                'error': f'Invalid path: {source_path if not src_valid else dest_path}'
+            }
+        
+        st = self._stat(src_full)
+        if st is None:
+            return {
+                'success': False,
+                'error': f'File not found: {source_path}'
+            }
+        
+        if not stat.S_ISREG(st.st_mode):
+            return {
+                'success': False,
+                'error': f'Path is not a file: {source_path}'
+            }
+        
+        if self._stat(dst_full) is not None:
+            return {
+                'success': False,
+                'error': f'File already exists: {dest_path}'
+            }
+        
+        for full in (src_full, dst_full):
+            if not self._is_text_file(full):
+                return {
+                    'success': False,
+                    'error': f'Unsupported file type: {os.path.splitext(full)[1]}'
+                }
+        
+        try:
+            os.makedirs(os.path.dirname(dst_full), exist_ok=True)
+            # copyfile uses sendfile/copy_file_range/fcopyfile fast paths, no userspace buffers
+            shutil.copyfile(src_full, dst_full)
+            
+            return {
+                'success': True,
+                'file_path': dst_full,
+                'size': st.st_size
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Copy error: {str(e)}'
+            }
+    
+    @staticmethod
+    def _replacements_independent(ops: List[tuple]) -> bool:
+        """
+        Check if replacements can be applied in one pass with the same result
+        as applying them one after another: no two originals can overlap, and
+        no earlier new_text can create or touch a later original
+        """
+        if not 1 < len(ops) <= _COMBINED_REPLACE_MAX:
+            return False
+        for i, (original_i, new_i, _) in enumerate(ops):
+            for original_j, _, _ in ops[i + 1:]:
+                if _can_overlap(original_i, original_j) or _can_overlap(new_i, original_j):
+                    return False
+        return True
+    
+    @staticmethod
+    def _replace_combined(content, ops: List[tuple]) -> tuple:
+        """
+        Apply independent replacements in a single pass over content
+        Returns: (new_content, replacements_made, error)
+        """
+        if all(len(original) == 1 and len(new_text) == 1 for original, new_text, _ in ops):
+            # Single characters: one C-level translate pass
+            counts = [content.count(original) for original, _, _ in ops]
+            if isinstance(content, bytes):
+                table = bytes.maketrans(b''.join(op[0] for op in ops),
+                                        b''.join(op[1] for op in ops))
+            else:
+                table = {ord(original): new_text for original, new_text, _ in ops}
+            replace = lambda: content.translate(table)
+        else:
+            separator = b'|' if isinstance(content, bytes) else '|'
+            pattern = re.compile(separator.join(re.escape(op[0]) for op in ops))
+            found = {}
+            for match in pattern.findall(content):
+                found[match] = found.get(match, 0) + 1
+            counts = [found.get(original, 0) for original, _, _ in ops]
+            mapping = {original: new_text for original, new_text, _ in ops}
+            replace = lambda: pattern.sub(lambda m: mapping[m.group(0)], content)
+        
+        for idx, ((_, _, replace_all), count) in enumerate(zip(ops, counts)):
+            if count == 0:
+                return content, 0, f'Replacement {idx}: original_text not found in file'
+            if not replace_all and count > 1:
+                return content, 0, f'Replacement {idx}: original_text appears {count} times (not unique). Set replace_all=true or make original_text more specific.'
+        
+        return replace(), sum(counts), None
+    
     def delete_file(self, file_path: str) -> Dict[str, Any]:
         """
         Delete file
@@ -276,20 +565,21 @@ class File:
                 'error': f'Invalid path: {file_path}'
             }
         
-        if not full_path.exists():
+        st = self._stat(full_path)
+        if st is None:
             return {
                 'success': False,
                 'error': f'File not found: {file_path}'
             }
         
-        if full_path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             return {
                 'success': False,
                 'error': f'Path is a directory, not a file: {file_path}'
             }
         
         try:
-            full_path.unlink()
+            os.unlink(full_path)
             return {'success': True}
         except Exception as e:
             return {
@@ -320,13 +610,14 @@ class File:
                 'error': f'Invalid path: {directory}'
             }
         
-        if not full_path.exists():
+        st = self._stat(full_path)
+        if st is None:
             return {
                 'success': False,
                 'error': f'Directory not found: {directory}'
             }
         
-        if not full_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             return {
                 'success': False,
                 'error': f'Path is not a directory: {directory}'
@@ -335,26 +626,31 @@ class File:
         try:
             files = []
             directories = []
+            prefix_len = len(self._root_sep)
             
             if recursive:
-                for item in full_path.rglob('*'):
-                    rel_path = item.relative_to(self.workdir)
-                    if item.is_file():
-                        files.append(str(rel_path))
-                    elif item.is_dir():
-                        directories.append(str(rel_path))
+                # os.walk classifies entries from scandir in one pass per directory
+                for dirpath, dirnames, filenames in os.walk(full_path, followlinks=False):
+                    rel_dir = dirpath[prefix_len:]
+                    directories.extend(os.path.join(rel_dir, name) for name in dirnames)
+                    files.extend(os.path.join(rel_dir, name) for name in filenames)
             else:
-                for item in full_path.iterdir():
-                    rel_path = item.relative_to(self.workdir)
-                    if item.is_file():
-                        files.append(str(rel_path))
-                    elif item.is_dir():
-                        directories.append(str(rel_path))
+                # scandir entries carry the file type, so no extra stat per entry
+                with os.scandir(full_path) as entries:
+                    for entry in entries:
+                        rel_path = entry.path[prefix_len:]
+                        if entry.is_file():
+                            files.append(rel_path)
+                        elif entry.is_dir():
+                            directories.append(rel_path)
+            
+            files.sort()
+            directories.sort()
             
             return {
                 'success': True,
-                'files': sorted(files),
-                'directories': sorted(directories)
+                'files': files,
+                'directories': directories
             }
         except Exception as e:
             return {
@@ -362,6 +658,86 @@ class File:
                 'error': f'List error: {str(e)}'
             }
     
+    def read_files(self, file_paths: List[str]) -> Dict[str, Any]:
+        """
+        Read multiple files concurrently
+        
+        Args:
+            file_paths: List of relative paths from workdir
+            
+        Returns:
+            {
+                'success': bool,         # True only if every read succeeded
+                'results': List[Dict],   # read_file() result per path, in input order
+                'error': str
+            }
+        """
+        try:
+            results = self._map(self.read_file, file_paths)
+            return {
+                'success': all(r['success'] for r in results),
+                'results': results
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Batch read error: {str(e)}'
+            }
+    
+    def create_files(self, files: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Create multiple files concurrently
+        
+        Args:
+            files: List of files to create
+                [
+                    {
+                        'file_path': str,   # Relative path from workdir
+                        'content': str      # File content
+                    }
+                ]
+        
+        Returns:
+            {
+                'success': bool,         # True only if every create succeeded
+                'results': List[Dict],   # create_file() result per item, in input order
+                'error': str
+            }
+        """
+        for idx, item in enumerate(files):
+            if item.get('file_path') is None or item.get('content') is None:
+                return {
+                    'success': False,
+                    'error': f'File {idx}: missing file_path or content'
+                }
+        
+        try:
+            results = self._map(
+                lambda item: self.create_file(item['file_path'], item['content']),
+                files
+            )
+            return {
+                'success': all(r['success'] for r in results),
+                'results': results
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Batch create error: {str(e)}'
+            }
+    
+    def close(self):
+        """Shut down the batch thread pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def __repr__(self):
         return f"<File workdir={self.workdir}>"
 
@@ -432,12 +808,28 @@ def demo():
     result = file_ops.create_file("test.pdf", "fake pdf")
     print(f"   Result: {result}\n")
     
-    # 10. Delete file
-    print("10. Delete file:")
+    # 10. Copy file
+    print("10. Copy file:")
+    result = file_ops.copy_file("test.py", "test_copy.py")
+    print(f"   Result: {result}\n")
+    
+    # 11. Delete file
+    print("11. Delete file:")
     result = file_ops.delete_file("test.py")
     print(f"   Result: {result}\n")
     
+    # 12. Batch create and read
+    print("12. Batch create and read:")
+    result = file_ops.create_files([
+        {'file_path': f"batch/file_{i}.txt", 'content': f"File {i}\n"}
+        for i in range(5)
+    ])
+    print(f"   Created: {result['success']}")
+    result = file_ops.read_files([f"batch/file_{i}.txt" for i in range(5)])
+    print(f"   Contents: {[r.get('content') for r in result['results']]}\n")
+    
     # Cleanup
+    file_ops.close()
     shutil.rmtree(temp_dir)
     print("Demo completed. Temp directory cleaned.")
 
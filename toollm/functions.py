@@ -4,7 +4,8 @@ Function-style API for toollm
 Provides stateless function wrappers for easy integration with AI frameworks
 like LangChain, OpenAI Function Calling, etc.
 
-All functions create temporary instances internally and return structured results.
+All functions return structured results. Tool instances are cached per workdir,
+so repeated calls reuse resolved paths and pooled HTTP connections.
 """
 
 from typing import Dict, Any, Optional, List
@@ -14,6 +15,58 @@ from .file import File
 from .process import Process
 from .system import System
 import tempfile
+import atexit
+import functools
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ============================================================================
+# Cached Instances
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _download_root() -> str:
+    """Shared temp root for downloads without a workdir, removed at exit"""
+    path = tempfile.mkdtemp(prefix="toollm_download_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_fetch(workdir: Optional[str], timeout: int) -> Fetch:
+    return Fetch(workdir=workdir, timeout=timeout)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_file(workdir: str) -> File:
+    return File(workdir=workdir)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_runner(workdir: str) -> CommandRunner:
+    return CommandRunner(workdir=workdir)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_system() -> System:
+    return System()
+
+
+def _get_fetch(workdir: Optional[str], timeout: int) -> Fetch:
+    """Get the cached Fetch for workdir (no workdir if None, for get-only use)"""
+    return _cached_fetch(os.path.abspath(workdir) if workdir else None, timeout)
+
+
+def _get_file(workdir: str) -> File:
+    """Get the cached File for workdir"""
+    return _cached_file(os.path.abspath(workdir))
+
+
+def _get_runner(workdir: str) -> CommandRunner:
+    """Get the cached CommandRunner for workdir"""
+    return _cached_runner(os.path.abspath(workdir))
 
 
 # ============================================================================
@@ -41,13 +94,15 @@ def execute_command(command: str, workdir: Optional[str] = None,
             'error': str  # On failure
         }
     """
-    runner = CommandRunner(workdir=workdir, timeout=timeout)
+    if workdir:
+        return _get_runner(workdir).execute(command, timeout=timeout, **kwargs)
+    
+    runner = CommandRunner(timeout=timeout)
     try:
         result = runner.execute(command, **kwargs)
         return result
     finally:
-        if not workdir:  # Clean up temp dir
-            runner.cleanup()
+        runner.cleanup()  # Clean up temp dir
 
 
 def list_workdir_files(workdir: str) -> List[str]:
@@ -60,8 +115,7 @@ def list_workdir_files(workdir: str) -> List[str]:
     Returns:
         List of filenames
     """
-    runner = CommandRunner(workdir=workdir)
-    return runner.list_files()
+    return _get_runner(workdir).list_files()
 
 
 def read_workdir_file(workdir: str, filename: str) -> Optional[str]:
@@ -75,8 +129,7 @@ def read_workdir_file(workdir: str, filename: str) -> Optional[str]:
     Returns:
         File content or None on error
     """
-    runner = CommandRunner(workdir=workdir)
-    return runner.read_file(filename)
+    return _get_runner(workdir).read_file(filename)
 
 
 def write_workdir_file(workdir: str, filename: str, content: str) -> bool:
@@ -91,8 +144,7 @@ def write_workdir_file(workdir: str, filename: str, content: str) -> bool:
     Returns:
         True on success, False on error
     """
-    runner = CommandRunner(workdir=workdir)
-    return runner.write_file(filename, content)
+    return _get_runner(workdir).write_file(filename, content)
 
 
 # ============================================================================
@@ -121,18 +173,7 @@ def fetch_url(url: str, format: str = 'content', workdir: Optional[str] = None,
             'error': str  # On failure
         }
     """
-    temp_dir = None
-    if workdir is None:
-        temp_dir = tempfile.mkdtemp(prefix="fetch_")
-        workdir = temp_dir
-    
-    try:
-        fetch = Fetch(workdir=workdir, timeout=timeout)
-        return fetch.get(url, format=format, headers=headers)
-    finally:
-        if temp_dir:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+    return _get_fetch(workdir, timeout).get(url, format=format, headers=headers)
 
 
 def download_file(url: str, filename: Optional[str] = None, 
@@ -144,7 +185,7 @@ def download_file(url: str, filename: Optional[str] = None,
     Args:
         url: Target URL
         filename: Save as filename (auto-detect if None)
-        workdir: Working directory (creates temp dir if None)
+        workdir: Working directory (creates temp dir if None, removed at interpreter exit)
         headers: Optional HTTP headers
         timeout: Request timeout in seconds
         
@@ -157,13 +198,92 @@ def download_file(url: str, filename: Optional[str] = None,
             'error': str  # On failure
         }
     """
-    temp_dir = None
     if workdir is None:
-        temp_dir = tempfile.mkdtemp(prefix="download_")
-        workdir = temp_dir
+        # Own dir per call so downloads never collide, all under one root removed at exit
+        with Fetch(workdir=tempfile.mkdtemp(prefix="download_", dir=_download_root()),
+                   timeout=timeout) as fetch:
+            return fetch.download(url, filename=filename, headers=headers)
+    
+    return _get_fetch(workdir, timeout).download(url, filename=filename, headers=headers)
+
+
+def fetch_urls(urls: List[str], format: str = 'content', workdir: Optional[str] = None,
+               headers: Optional[Dict] = None, timeout: int = 30,
+               max_workers: int = 16) -> List[Dict[str, Any]]:
+    """
+    Fetch multiple URLs in parallel threads over one shared session
+    
+    Args:
+        urls: Target URLs
+        format: Response format ('content', 'raw', or 'json')
+        workdir: Working directory for downloads
+        headers: Optional HTTP headers applied to every request
+        timeout: Request timeout in seconds
+        max_workers: Maximum number of concurrent requests
+        
+    Returns:
+        List of fetch_url() results, in the same order as urls
+    """
+    fetch = _get_fetch(workdir, timeout)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls) or 1))) as ex:
+        return list(ex.map(lambda url: fetch.get(url, format=format, headers=headers), urls))
+
+
+def download_files(urls: List[str], workdir: Optional[str] = None,
+                   headers: Optional[Dict] = None, timeout: int = 30,
+                   max_workers: int = 16) -> List[Dict[str, Any]]:
+    """
+    Download multiple files in parallel threads over one shared session
+    
+    Args:
+        urls: Target URLs (filenames are auto-detected; names that collide within
+              the batch get a _1, _2, ... suffix)
+        workdir: Working directory (creates one temp dir for the batch if None, removed at interpreter exit)
+        headers: Optional HTTP headers applied to every request
+        timeout: Request timeout in seconds
+        max_workers: Maximum number of concurrent downloads
+        
+    Returns:
+        List of download_file() results, in the same order as urls
+    """
+    if workdir is None:
+        # One fresh dir for the batch, not cached (see download_file)
+        with Fetch(workdir=tempfile.mkdtemp(prefix="download_", dir=_download_root()),
+                   timeout=timeout) as fetch:
+            return _download_all(fetch, urls, headers, max_workers)
     
-    fetch = Fetch(workdir=workdir, timeout=timeout)
-    return fetch.download(url, filename=filename, headers=headers)
+    return _download_all(_get_fetch(workdir, timeout), urls, headers, max_workers)
+
+
+def _download_all(fetch: Fetch, urls: List[str], headers: Optional[Dict],
+                  max_workers: int) -> List[Dict[str, Any]]:
+    # URLs that map to the same filename get unique names (file.zip, file_1.zip, ...)
+    with fetch._download_batch(), \
+            ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls) or 1))) as ex:
+        return list(ex.map(lambda url: fetch.download(url, headers=headers), urls))
+
+
+async def afetch_urls(urls: List[str], format: str = 'content',
+                      headers: Optional[Dict] = None, timeout: int = 30) -> List[Dict[str, Any]]:
+    """
+    Fetch multiple URLs concurrently (requires aiohttp)
+    
+    Args:
+        urls: Target URLs
+        format: Response format ('content', 'raw', or 'json')
+        headers: Optional HTTP headers applied to every request
+        timeout: Request timeout in seconds
+        
+    Returns:
+        List of fetch_url() results, in the same order as urls
+    """
+    import asyncio
+    
+    # Not cached: the aiohttp session is bound to the running event loop
+    async with Fetch(timeout=timeout) as fetch:
+        return list(await asyncio.gather(
+            *(fetch.aget(url, format=format, headers=headers) for url in urls)
+        ))
 
 
 # ============================================================================
@@ -190,8 +310,25 @@ def read_file(file_path: str, workdir: str, start_line: Optional[int] = None,
             'error': str  # On failure
         }
     """
-    file_ops = File(workdir=workdir)
-    return file_ops.read_file(file_path, start_line=start_line, end_line=end_line)
+    return _get_file(workdir).read_file(file_path, start_line=start_line, end_line=end_line)
+
+
+def read_files(file_paths: List[str], workdir: str) -> Dict[str, Any]:
+    """
+    Read multiple files concurrently
+    
+    Args:
+        file_paths: Relative paths from workdir
+        workdir: Working directory root
+        
+    Returns:
+        {
+            'success': bool,
+            'results': List[Dict],  # read_file() result per path
+            'error': str  # On failure
+        }
+    """
+    return _get_file(workdir).read_files(file_paths)
 
 
 def create_file(file_path: str, content: str, workdir: str) -> Dict[str, Any]:
@@ -210,8 +347,31 @@ def create_file(file_path: str, content: str, workdir: str) -> Dict[str, Any]:
             'error': str  # On failure
         }
     """
-    file_ops = File(workdir=workdir)
-    return file_ops.create_file(file_path, content)
+    return _get_file(workdir).create_file(file_path, content)
+
+
+def create_files(files: List[Dict[str, str]], workdir: str) -> Dict[str, Any]:
+    """
+    Create multiple files concurrently
+    
+    Args:
+        files: List of files to create
+            [
+                {
+                    'file_path': str,
+                    'content': str
+                }
+            ]
+        workdir: Working directory root
+        
+    Returns:
+        {
+            'success': bool,
+            'results': List[Dict],  # create_file() result per item
+            'error': str  # On failure
+        }
+    """
+    return _get_file(workdir).create_files(files)
 
 
 def replace_in_file(file_path: str, replacements: List[Dict[str, Any]], 
@@ -238,8 +398,27 @@ def replace_in_file(file_path: str, replacements: List[Dict[str, Any]],
             'error': str  # On failure
         }
     """
-    file_ops = File(workdir=workdir)
-    return file_ops.search_replace(file_path, replacements)
+    return _get_file(workdir).search_replace(file_path, replacements)
+
+
+def copy_file(source_path: str, dest_path: str, workdir: str) -> Dict[str, Any]:
+    """
+    Copy file within workdir
+    
+    Args:
+        source_path: Relative path of existing file
+        dest_path: Relative path of new file (must not exist)
+        workdir: Working directory root
+        
+    Returns:
+        {
+            'success': bool,
+            'file_path': str,
+            'size': int,
+            'error': str  # On failure
+        }
+    """
+    return _get_file(workdir).copy_file(source_path, dest_path)
 
 
 def delete_file(file_path: str, workdir: str) -> Dict[str, Any]:
@@ -256,8 +435,7 @@ def delete_file(file_path: str, workdir: str) -> Dict[str, Any]:
             'error': str  # On failure
         }
     """
-    file_ops = File(workdir=workdir)
-    return file_ops.delete_file(file_path)
+    return _get_file(workdir).delete_file(file_path)
 
 
 def list_files(directory: str = '.', workdir: str = '.', 
@@ -278,8 +456,7 @@ def list_files(directory: str = '.', workdir: str = '.',
             'error': str  # On failure
         }
     """
-    file_ops = File(workdir=workdir)
-    return file_ops.list_files(directory=directory, recursive=recursive)
+    return _get_file(workdir).list_files(directory=directory, recursive=recursive)
 
 
 # ============================================================================
@@ -287,24 +464,27 @@ def list_files(directory: str = '.', workdir: str = '.',
 # ============================================================================
 
 def list_processes(filter: Optional[str] = None, 
-                  sort_by: str = 'cpu') -> Dict[str, Any]:
+                  sort_by: str = 'cpu',
+                  limit: Optional[int] = None) -> Dict[str, Any]:
     """
     List running processes
     
     Args:
         filter: Filter by process name (substring match)
         sort_by: Sort by 'cpu', 'memory', 'pid', or 'name'
+        limit: Return only the top N processes (default: None = all)
         
     Returns:
         {
             'success': bool,
             'processes': List[Dict],
-            'count': int,
+            'count': int,  # Number returned
+            'total': int,  # Number matching before limit
             'error': str  # On failure
         }
     """
     proc_mgr = Process()
-    return proc_mgr.list(filter=filter, sort_by=sort_by)
+    return proc_mgr.list(filter=filter, sort_by=sort_by, limit=limit)
 
 
 def get_process_info(pid: int) -> Dict[str, Any]:
@@ -381,7 +561,7 @@ def get_system_info() -> Dict[str, Any]:
             'error': str  # On failure
         }
     """
-    sys_info = System()
+    sys_info = _cached_system()
     return sys_info.info()
 
 
@@ -404,18 +584,21 @@ def get_disk_usage(path: Optional[str] = None) -> Dict[str, Any]:
             'error': str  # On failure
         }
     """
-    sys_info = System()
+    sys_info = _cached_system()
     return sys_info.disk(path=path)
 
 
-def get_network_status() -> Dict[str, Any]:
+def get_network_status(include_connections: bool = False) -> Dict[str, Any]:
     """
     Get network status and statistics
     
+    Args:
+        include_connections: Also count open inet sockets (slower)
+    
     Returns:
         {
             'success': bool,
-            'connections': int,
+            'connections': int,  # None unless include_connections
             'bytes_sent_mb': float,
             'bytes_recv_mb': float,
             'packets_sent': int,
@@ -424,8 +607,8 @@ def get_network_status() -> Dict[str, Any]:
             'error': str  # On failure
         }
     """
-    sys_info = System()
-    return sys_info.network()
+    sys_info = _cached_system()
+    return sys_info.network(include_connections=include_connections)
 
 
 def get_env_var(key: Optional[str] = None) -> Dict[str, Any]:
@@ -445,5 +628,5 @@ def get_env_var(key: Optional[str] = None) -> Dict[str, Any]:
             'error': str                  # On failure
         }
     """
-    sys_info = System()
+    sys_info = _cached_system()
     return sys_info.env(key=key)
@@ -1,7 +1,173 @@
+import contextlib
+import heapq
 import psutil
 import signal
 import os
-from typing import Dict, Any, List, Optional
+import sys
+import time
+from operator import attrgetter
+from typing import Callable, Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class ProcRec(NamedTuple):
+    """One Process.list row; a fixed-size tuple instead of a per-process dict"""
+    pid: int
+    name: str
+    username: str
+    status: str
+    cpu_percent: float
+    memory_mb: float
+    create_time: float
+
+
+# Attributes read for every process in Process.list (one oneshot per process)
+_LIST_ATTRS = ['pid', 'name', 'username', 'status', 'cpu_percent', 'memory_info', 'create_time']
+_LIST_ATTRS_NO_NAME = [attr for attr in _LIST_ATTRS if attr != 'name']
+
+# Bytes -> MB as one multiply (power-of-two reciprocal, so results are exact)
+_INV_MB = 1.0 / 1048576.0
+
+# Names, statuses and users repeat heavily across processes; share one str each
+_intern = sys.intern
+
+# Sort keys for Process.list (attrgetter runs in C; name needs case folding)
+_SORT_KEYS = {
+    'cpu': attrgetter('cpu_percent'),
+    'memory': attrgetter('memory_mb'),
+    'pid': attrgetter('pid'),
+    'name': lambda rec: rec.name.lower()
+}
+
+# System process indicators used by Process._is_system_process
+_SYSTEM_TOKENS = (
+    'system', 'kernel', 'init', 'systemd', 'launchd',
+    'csrss', 'smss', 'wininit', 'services', 'lsass',
+    'svchost', 'explorer'
+)
+_SYSTEM_PIDS = frozenset((0, 1, 4))
+_SYSTEM_USERS = frozenset(('root', 'system', 'nt authority\\system'))
+
+
+def _gather(pids: List[int], filter: Optional[str] = None, interval: float = 0.1,
+            get_proc: Callable[[int], psutil.Process] = psutil.Process,
+            sort_by: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[ProcRec], int]:
+    """
+    Collect Process.list records for a batch of PIDs
+    
+    CPU counters are primed for the whole batch, then read after one
+    shared sampling window.
+    get_proc lets the caller supply cached psutil.Process handles.
+    
+    Returns (records, matched): matched counts processes that passed the
+    filter, including any dropped early by a pid/name limit.
+    """
+    name_filter = filter.lower() if filter else None
+    prelimit = limit is not None and sort_by in ('pid', 'name')
+    
+    # Stage 1: when filtering or limiting by pid/name, read only the name first
+    # so the full attribute read and CPU sampling run on survivors alone
+    if name_filter or prelimit:
+        survivors = []
+        for pid in pids:
+            try:
+                proc = get_proc(pid)
+                name = proc.name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            
+            # Apply filter
+            if name_filter and name_filter not in name.lower():
+                continue
+            
+            survivors.append((proc, name))
+        
+        matched = len(survivors)
+        
+        # pid/name order is already known, so drop processes the limit would discard
+        if prelimit and limit < matched:
+            key = (lambda s: s[0].pid) if sort_by == 'pid' else (lambda s: s[1].lower())
+            survivors = heapq.nsmallest(limit, survivors, key=key)
+        
+        attrs = _LIST_ATTRS_NO_NAME
+    else:
+        survivors = []
+        for pid in pids:
+            try:
+                survivors.append((get_proc(pid), None))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        matched = None
+        attrs = _LIST_ATTRS
+    
+    # Pass 1: read every remaining attribute in one batched oneshot per process,
+    # and prime CPU counters (the 'cpu_percent' attr is a non-blocking call)
+    sampled = []
+    for proc, name in survivors:
+        try:
+            pinfo = proc.as_dict(attrs)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        
+        # Unreadable memory/start time (access denied) excludes the process
+        if pinfo['memory_info'] is None or pinfo['create_time'] is None:
+            continue
+        
+        if name is not None:
+            pinfo['name'] = name
+        sampled.append((proc, pinfo))
+    
+    # One shared sampling window instead of a 0.1s sleep per process
+    if sampled:
+        time.sleep(interval)
+    
+    # Pass 2: read CPU deltas
+    records = []
+    for proc, pinfo in sampled:
+        try:
+            cpu_percent = proc.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        
+        # Unreadable fields come back as None from as_dict; keep the row
+        records.append(ProcRec(
+            pinfo['pid'],
+            _intern(pinfo['name'] or ''),
+            _intern(pinfo['username'] or ''),
+            _intern(pinfo['status'] or ''),
+            round(cpu_percent, 2),
+            round(pinfo['memory_info'].rss * _INV_MB, 2),
+            pinfo['create_time']
+        ))
+    
+    return records, len(records) if matched is None else matched
+
+
+def _wait_gone(proc: psutil.Process, timeout: float) -> bool:
+    """
+    Wait up to timeout seconds for proc to exit, polling with backoff (1ms -> 100ms)
+    
+    A zombie counts as gone: it has exited and only awaits reaping by a parent
+    that may not be us, which a plain wait() would block on until timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        try:
+            proc.wait(timeout=delay)  # Reaps our own children immediately
+            return True
+        except psutil.TimeoutExpired:
+            pass
+        
+        try:
+            if proc.status() == psutil.STATUS_ZOMBIE:
+                return True
+        except psutil.NoSuchProcess:
+            return True
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        delay = min(delay * 2, 0.1, remaining)
 
 
 class Process:
@@ -25,20 +191,108 @@ class Process:
             allow_system_processes: Allow operations on system processes (default: False)
         """
         self.allow_system_processes = allow_system_processes
+        self._proc_cache: Dict[int, psutil.Process] = {}  # pid -> handle, validated by create_time
+        self._snap: Optional[Dict[str, Any]] = None  # Set inside snapshot()
     
-    def list(self, filter: Optional[str] = None, sort_by: str = 'cpu') -> Dict[str, Any]:
+    @contextlib.contextmanager
+    def snapshot(self) -> Iterator['Process']:
+        """
+        Freeze the process table for a batch of list/info/kill calls
+        
+        Inside the block the PID list is read once, unknown PIDs fail without
+        a kernel lookup, and cached handles skip the create_time recheck
+        (psutil still guards signals against PID reuse). Processes started
+        during the block are not visible to it. Nested use is a no-op.
+        
+        Usage:
+            with proc_mgr.snapshot():
+                for p in proc_mgr.list(filter='worker')['processes']:
+                    proc_mgr.info(p['pid'])
+        """
+        if self._snap is not None:
+            yield self
+            return
+        
+        pids = psutil.pids()
+        self._snap = {'pids': pids, 'pid_set': frozenset(pids)}
+        try:
+            yield self
+        finally:
+            self._snap = None
+    
+    def _get(self, pid: int) -> psutil.Process:
+        """
+        Return a cached psutil.Process for pid, creating it on first use
+        
+        A cached handle is reused only while its create_time still matches,
+        so a recycled PID gets a fresh handle; inside snapshot() the check
+        is skipped. Raises psutil.NoSuchProcess if the process is gone.
+        """
+        snap = self._snap
+        proc = self._proc_cache.get(pid)
+        if snap is not None:
+            if pid not in snap['pid_set']:
+                raise psutil.NoSuchProcess(pid)
+            if proc is not None:
+                return proc
+        elif proc is not None:
+            try:
+                if proc.is_running():  # Compares the stored create_time
+                    return proc
+            except psutil.Error:
+                pass
+            del self._proc_cache[pid]
+        
+        proc = psutil.Process(pid)
+        self._proc_cache[pid] = proc
+        return proc
+    
+    def list(self, filter: Optional[str] = None, sort_by: str = 'cpu',
+             limit: Optional[int] = None) -> Dict[str, Any]:
         """
         List running processes
         
         Args:
             filter: Filter by process name (substring match, case-insensitive)
             sort_by: Sort by 'cpu', 'memory', 'pid', or 'name' (default: 'cpu')
+            limit: Return only the top N processes in sort order (default: None = all)
             
         Returns:
             {
                 'success': bool,
                 'processes': List[Dict],  # List of process info
-                'count': int,             # Number of processes
+                'count': int,             # Number of processes returned
+                'total': int,             # Number of matching processes before limit
+                'error': str
+            }
+        """
+        result = self.list_records(filter=filter, sort_by=sort_by, limit=limit)
+        if not result['success']:
+            return result
+        
+        return {
+            'success': True,
+            'processes': [rec._asdict() for rec in result['records']],
+            'count': result['count'],
+            'total': result['total']
+        }
+    
+    def list_records(self, filter: Optional[str] = None, sort_by: str = 'cpu',
+                     limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        List running processes as ProcRec tuples (same fields as list(), no per-row dicts)
+        
+        Args:
+            filter: Filter by process name (substring match, case-insensitive)
+            sort_by: Sort by 'cpu', 'memory', 'pid', or 'name' (default: 'cpu')
+            limit: Return only the top N processes in sort order (default: None = all)
+            
+        Returns:
+            {
+                'success': bool,
+                'records': List[ProcRec], # Sorted process records
+                'count': int,             # Number of records returned
+                'total': int,             # Number of matching processes before limit
                 'error': str
             }
         """
@@ -48,50 +302,40 @@ class Process:
                 'error': f"Invalid sort_by: {sort_by}. Must be 'cpu', 'memory', 'pid', or 'name'"
             }
         
+        if limit is not None and limit < 0:
+            return {
+                'success': False,
+                'error': f'Invalid limit: {limit}. Must be >= 0'
+            }
+        
         try:
-            processes = []
+            pids = self._snap['pids'] if self._snap is not None else psutil.pids()
             
-            for proc in psutil.process_iter(['pid', 'name', 'username', 'status']):
-                try:
-                    pinfo = proc.info
-                    
-                    # Apply filter
-                    if filter and filter.lower() not in pinfo['name'].lower():
-                        continue
-                    
-                    # Get additional info
-                    with proc.oneshot():
-                        cpu_percent = proc.cpu_percent(interval=0.1)
-                        memory_info = proc.memory_info()
-                        create_time = proc.create_time()
-                    
-                    processes.append({
-                        'pid': pinfo['pid'],
-                        'name': pinfo['name'],
-                        'username': pinfo['username'],
-                        'status': pinfo['status'],
-                        'cpu_percent': round(cpu_percent, 2),
-                        'memory_mb': round(memory_info.rss / 1024 / 1024, 2),
-                        'create_time': create_time
-                    })
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            records, total = _gather(pids, filter, get_proc=self._get, sort_by=sort_by, limit=limit)
+            
+            # Drop cached handles of processes that have exited
+            if len(self._proc_cache) > len(pids):
+                live = set(pids)
+                for pid in [pid for pid in self._proc_cache if pid not in live]:
+                    del self._proc_cache[pid]
             
             # Sort processes
-            sort_key_map = {
-                'cpu': lambda x: x['cpu_percent'],
-                'memory': lambda x: x['memory_mb'],
-                'pid': lambda x: x['pid'],
-                'name': lambda x: x['name'].lower()
-            }
+            sort_key = _SORT_KEYS[sort_by]
+            
+            descending = sort_by in ['cpu', 'memory']
             
-            processes.sort(key=sort_key_map[sort_by], reverse=(sort_by in ['cpu', 'memory']))
+            if limit is not None and limit < len(records):
+                # Partial top-N selection: O(N log K) instead of a full sort
+                select = heapq.nlargest if descending else heapq.nsmallest
+                records = select(limit, records, key=sort_key)
+            else:
+                records.sort(key=sort_key, reverse=descending)
             
             return {
                 'success': True,
-                'processes': processes,
-                'count': len(processes)
+                'records': records,
+                'count': len(records),
+                'total': total
             }
             
         except Exception as e:
@@ -124,7 +368,7 @@ class Process:
             }
         """
         try:
-            proc = psutil.Process(pid)
+            proc = self._get(pid)
             
             with proc.oneshot():
                 info = {
@@ -134,7 +378,7 @@ class Process:
                     'status': proc.status(),
                     'username': proc.username(),
                     'cpu_percent': round(proc.cpu_percent(interval=0.1), 2),
-                    'memory_mb': round(proc.memory_info().rss / 1024 / 1024, 2),
+                    'memory_mb': round(proc.memory_info().rss * _INV_MB, 2),
                     'num_threads': proc.num_threads(),
                     'cmdline': proc.cmdline(),
                     'create_time': proc.create_time()
@@ -149,6 +393,7 @@ class Process:
             return info
             
         except psutil.NoSuchProcess:
+            self._proc_cache.pop(pid, None)
             return {
                 'success': False,
                 'error': f'Process {pid} not found'
@@ -181,7 +426,7 @@ class Process:
             }
         """
         try:
-            proc = psutil.Process(pid)
+            proc = self._get(pid)
             name = proc.name()
             
             # Safety check: prevent killing system processes
@@ -199,9 +444,9 @@ class Process:
                 proc.terminate()  # SIGTERM
             
             # Wait for process to terminate
-            try:
-                proc.wait(timeout=3)
-            except psutil.TimeoutExpired:
+            if _wait_gone(proc, timeout=3):
+                self._proc_cache.pop(pid, None)
+            else:
                 if not force:
                     return {
                         'success': False,
@@ -215,6 +460,7 @@ class Process:
             }
             
         except psutil.NoSuchProcess:
+            self._proc_cache.pop(pid, None)
             return {
                 'success': False,
                 'error': f'Process {pid} not found'
@@ -235,24 +481,19 @@ class Process:
         try:
             # Common system process indicators
             name = proc.name().lower()
-            system_names = [
-                'system', 'kernel', 'init', 'systemd', 'launchd',
-                'csrss', 'smss', 'wininit', 'services', 'lsass',
-                'svchost', 'explorer'
-            ]
             
             # Check by name
-            if any(sys_name in name for sys_name in system_names):
+            if any(token in name for token in _SYSTEM_TOKENS):
                 return True
             
             # Check by PID (0, 1, 4 are typically system)
-            if proc.pid in [0, 1, 4]:
+            if proc.pid in _SYSTEM_PIDS:
                 return True
             
             # Check by username (root/SYSTEM)
             try:
                 username = proc.username().lower()
-                if username in ['root', 'system', 'nt authority\\system']:
+                if username in _SYSTEM_USERS:
                     return True
             except:
                 pass
@@ -274,11 +515,11 @@ def demo():
     
     # 1. List all processes sorted by CPU
     print("1. List top 10 processes by CPU:")
-    result = proc_mgr.list(sort_by='cpu')
+    result = proc_mgr.list_records(sort_by='cpu', limit=10)
     if result['success']:
-        print(f"   Total processes: {result['count']}")
-        for p in result['processes'][:10]:
-            print(f"   PID {p['pid']:6} | {p['name']:30} | CPU: {p['cpu_percent']:6.2f}% | MEM: {p['memory_mb']:8.2f}MB")
+        print(f"   Total processes: {result['total']}")
+        for p in result['records']:
+            print(f"   PID {p.pid:6} | {p.name:30} | CPU: {p.cpu_percent:6.2f}% | MEM: {p.memory_mb:8.2f}MB")
         print()
     
     # 2. Filter processes by name
@@ -1,9 +1,98 @@
 import psutil
 import platform
+import functools
 import os
+import socket
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Tuple[str, str, str, str, Optional[int]]:
+    """Static host facts: (system, version, machine, hostname, logical cpu count)"""
+    return (
+        platform.system(),
+        platform.version(),
+        platform.machine(),
+        platform.node(),
+        psutil.cpu_count(logical=True),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _boot_time() -> Tuple[float, str]:
+    """Boot time as (epoch seconds, formatted local time); fixed until reboot"""
+    boot_ts = psutil.boot_time()
+    return boot_ts, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(boot_ts))
+
+
+# Byte conversions as one multiply (power-of-two reciprocals, so results are exact)
+_INV_MB = 1.0 / 1048576.0
+_INV_GB = 1.0 / 1073741824.0
+
+# CPU usage is re-sampled at most this often (seconds); calls in between reuse it
+_CPU_REFRESH_INTERVAL = 1.0
+
+# Shortest window a first sample is taken over, so it is not just noise
+_CPU_MIN_WINDOW = 0.1
+
+# Seconds a mount table snapshot stays valid
+_MOUNT_TABLE_TTL = 30.0
+
+
+@functools.lru_cache(maxsize=1)
+def _mount_table(_epoch: int) -> List[Tuple[str, Any]]:
+    """
+    Mounted partitions as (normalized mountpoint + sep, partition), longest first
+    
+    _epoch is the current TTL bucket; a new bucket evicts the old snapshot.
+    """
+    table = []
+    for part in psutil.disk_partitions(all=False):
+        prefix = os.path.normcase(part.mountpoint)
+        if not prefix.endswith(os.sep):
+            prefix += os.sep
+        table.append((prefix, part))
+    table.sort(key=lambda entry: len(entry[0]), reverse=True)
+    return table
+
+
+# Seconds the socket count and interface tables stay valid
+_NET_CONNECTIONS_TTL = 1.0
+_NET_IF_TTL = 5.0
+
+
+@functools.lru_cache(maxsize=1)
+def _net_connection_count(_epoch: int) -> int:
+    """Number of inet (TCP/UDP) sockets, -1 without privileges; cached per TTL bucket"""
+    try:
+        return len(psutil.net_connections(kind='inet'))
+    except psutil.AccessDenied:
+        return -1  # Requires elevated privileges
+
+
+@functools.lru_cache(maxsize=1)
+def _net_if_info(_epoch: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(net_if_addrs, net_if_stats); interfaces rarely change, cached per TTL bucket"""
+    return psutil.net_if_addrs(), psutil.net_if_stats()
+
+
+@functools.lru_cache(maxsize=128)
+def _env_value(key: str) -> Optional[str]:
+    """Memoized os.environ lookup behind System.env_get(cached=True); cleared by System.refresh_env"""
+    return os.environ.get(key)
+
+
+def _find_partition(path: str) -> Optional[Any]:
+    """Partition whose mountpoint is the longest prefix of path"""
+    target = os.path.normcase(os.path.realpath(path))
+    if not target.endswith(os.sep):
+        target += os.sep
+    for prefix, part in _mount_table(int(time.monotonic() // _MOUNT_TABLE_TTL)):
+        if target.startswith(prefix):
+            return part
+    return None
 
 
 class System:
@@ -22,7 +111,20 @@ class System:
     
     def __init__(self):
         """Initialize system monitor"""
-        pass
+        # Prime the non-blocking CPU counter; info() reads the delta since then
+        psutil.cpu_percent(interval=None)
+        self._last_cpu_ts = time.monotonic()
+        self._last_cpu_val: Optional[float] = None
+    
+    def _cpu_percent(self) -> float:
+        """System-wide CPU usage, sampled without blocking and cached for a second"""
+        elapsed = time.monotonic() - self._last_cpu_ts
+        if self._last_cpu_val is None or elapsed >= _CPU_REFRESH_INTERVAL:
+            if self._last_cpu_val is None and elapsed < _CPU_MIN_WINDOW:
+                time.sleep(_CPU_MIN_WINDOW - elapsed)
+            self._last_cpu_val = psutil.cpu_percent(interval=None)
+            self._last_cpu_ts = time.monotonic()
+        return self._last_cpu_val
     
     def info(self) -> Dict[str, Any]:
         """
@@ -46,28 +148,29 @@ class System:
             }
         """
         try:
-            # Get CPU info
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Get CPU info (rolling sample, no 1s block per call)
+            cpu_percent = self._cpu_percent()
             
             # Get memory info
             memory = psutil.virtual_memory()
             
-            # Get boot time
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime_seconds = (datetime.now() - boot_time).total_seconds()
+            # Static fields are computed once per interpreter
+            system, version, machine, hostname, cpu_count = _platform_info()
+            boot_ts, boot_time = _boot_time()
+            uptime_seconds = time.time() - boot_ts
             
             return {
                 'success': True,
-                'platform': platform.system(),
-                'platform_version': platform.version(),
-                'architecture': platform.machine(),
-                'hostname': platform.node(),
-                'cpu_count': psutil.cpu_count(logical=True),
+                'platform': system,
+                'platform_version': version,
+                'architecture': machine,
+                'hostname': hostname,
+                'cpu_count': cpu_count,
                 'cpu_percent': round(cpu_percent, 2),
-                'memory_total_gb': round(memory.total / 1024 / 1024 / 1024, 2),
-                'memory_used_gb': round(memory.used / 1024 / 1024 / 1024, 2),
+                'memory_total_gb': round(memory.total * _INV_GB, 2),
+                'memory_used_gb': round(memory.used * _INV_GB, 2),
                 'memory_percent': round(memory.percent, 2),
-                'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S'),
+                'boot_time': boot_time,
                 'uptime_hours': round(uptime_seconds / 3600, 2)
             }
             
@@ -102,19 +205,15 @@ class System:
             # Get disk usage
             usage = psutil.disk_usage(target_path)
             
-            # Get partition info
-            partition = None
-            for part in psutil.disk_partitions():
-                if target_path.startswith(part.mountpoint):
-                    partition = part
-                    break
+            # Get partition info (longest matching mountpoint)
+            partition = _find_partition(target_path)
             
             return {
                 'success': True,
                 'path': target_path,
-                'total_gb': round(usage.total / 1024 / 1024 / 1024, 2),
-                'used_gb': round(usage.used / 1024 / 1024 / 1024, 2),
-                'free_gb': round(usage.free / 1024 / 1024 / 1024, 2),
+                'total_gb': round(usage.total * _INV_GB, 2),
+                'used_gb': round(usage.used * _INV_GB, 2),
+                'free_gb': round(usage.free * _INV_GB, 2),
                 'percent': round(usage.percent, 2),
                 'mount_point': partition.mountpoint if partition else 'N/A'
             }
@@ -125,14 +224,18 @@ class System:
                 'error': f'Disk error: {str(e)}'
             }
     
-    def network(self) -> Dict[str, Any]:
+    def network(self, include_connections: bool = False) -> Dict[str, Any]:
         """
         Get network status and statistics
         
+        Args:
+            include_connections: Count open inet sockets; this enumerates every
+                                 socket on the host, so it is opt-in (default: False)
+        
         Returns:
             {
                 'success': bool,
-                'connections': int,          # Number of active connections
+                'connections': int,          # Active inet connections (None unless requested, -1 if denied)
                 'bytes_sent_mb': float,      # Total bytes sent in MB
                 'bytes_recv_mb': float,      # Total bytes received in MB
                 'packets_sent': int,         # Total packets sent
@@ -145,23 +248,28 @@ class System:
             # Get network IO stats
             net_io = psutil.net_io_counters()
             
-            # Get network connections
-            try:
-                connections = len(psutil.net_connections())
-            except psutil.AccessDenied:
-                connections = -1  # Requires elevated privileges
+            # Get network connections (expensive, only on request)
+            connections = None
+            if include_connections:
+                connections = _net_connection_count(int(time.monotonic() // _NET_CONNECTIONS_TTL))
             
             # Get interface info
             interfaces = []
-            net_if_addrs = psutil.net_if_addrs()
-            net_if_stats = psutil.net_if_stats()
+            net_if_addrs, net_if_stats = _net_if_info(int(time.monotonic() // _NET_IF_TTL))
+            af_inet, af_inet6 = socket.AF_INET, socket.AF_INET6
             
             for interface_name, addrs in net_if_addrs.items():
                 stats = net_if_stats.get(interface_name)
                 
-                # Get IP addresses
-                ipv4 = [addr.address for addr in addrs if addr.family == 2]
-                ipv6 = [addr.address for addr in addrs if addr.family == 23 or addr.family == 30]
+                # Get IP addresses in one pass (platform AF_* values, e.g. AF_INET6 is 10/23/30)
+                ipv4 = []
+                ipv6 = []
+                for addr in addrs:
+                    family = addr.family
+                    if family == af_inet:
+                        ipv4.append(addr.address)
+                    elif family == af_inet6:
+                        ipv6.append(addr.address)
                 
                 interfaces.append({
                     'name': interface_name,
@@ -174,8 +282,8 @@ class System:
             return {
                 'success': True,
                 'connections': connections,
-                'bytes_sent_mb': round(net_io.bytes_sent / 1024 / 1024, 2),
-                'bytes_recv_mb': round(net_io.bytes_recv / 1024 / 1024, 2),
+                'bytes_sent_mb': round(net_io.bytes_sent * _INV_MB, 2),
+                'bytes_recv_mb': round(net_io.bytes_recv * _INV_MB, 2),
                 'packets_sent': net_io.packets_sent,
                 'packets_recv': net_io.packets_recv,
                 'interfaces': interfaces
@@ -203,31 +311,81 @@ class System:
                 'error': str
             }
         """
+        if key:
+            return self.env_get(key)
+        return self.env_all()
+    
+    def env_get(self, key: str, cached: bool = False) -> Dict[str, Any]:
+        """
+        Get a single environment variable (no copy of the environment)
+        
+        Args:
+            key: Environment variable key
+            cached: Memoize the lookup for hot repeated keys; later changes to
+                os.environ are not seen until refresh_env() is called
+            
+        Returns:
+            {
+                'success': bool,
+                'key': str,
+                'value': str,
+                'error': str
+            }
+        """
         try:
-            if key:
-                # Get specific variable
-                value = os.environ.get(key)
-                if value is None:
-                    return {
-                        'success': False,
-                        'error': f'Environment variable "{key}" not found'
-                    }
-                
+            value = _env_value(key) if cached else os.environ.get(key)
+            if value is None:
                 return {
-                    'success': True,
-                    'key': key,
-                    'value': value
+                    'success': False,
+                    'error': f'Environment variable "{key}" not found'
                 }
-            else:
-                # Get all variables
-                variables = dict(os.environ)
-                
+            
+            return {
+                'success': True,
+                'key': key,
+                'value': value
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Env error: {str(e)}'
+            }
+    
+    def refresh_env(self) -> None:
+        """Drop memoized env_get(cached=True) values so the next lookups read os.environ"""
+        _env_value.cache_clear()
+    
+    def env_all(self, count_only: bool = False) -> Dict[str, Any]:
+        """
+        Get all environment variables
+        
+        Args:
+            count_only: Only return the count, skipping the copy (default: False)
+            
+        Returns:
+            {
+                'success': bool,
+                'variables': Dict[str, str],  # Omitted when count_only
+                'count': int,
+                'error': str
+            }
+        """
+        try:
+            if count_only:
                 return {
                     'success': True,
-                    'variables': variables,
-                    'count': len(variables)
+                    'count': len(os.environ)
                 }
-                
+            
+            variables = os.environ.copy()
+            
+            return {
+                'success': True,
+                'variables': variables,
+                'count': len(variables)
+            }
+            
         except Exception as e:
             return {
                 'success': False,
@@ -272,7 +430,7 @@ def demo():
     
     # 3. Get network status
     print("3. Network Status:")
-    result = sys_info.network()
+    result = sys_info.network(include_connections=True)
     if result['success']:
         print(f"   Active Connections: {result['connections']}")
         print(f"   Bytes Sent: {result['bytes_sent_mb']}MB")
@@ -293,7 +451,7 @@ def demo():
         print()
     
     # 5. Count all environment variables
-    result = sys_info.env()
+    result = sys_info.env_all(count_only=True)
     if result['success']:
         print(f"   Total environment variables: {result['count']}")
         print()